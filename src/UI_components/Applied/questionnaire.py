@@ -99,7 +99,7 @@ except ImportError:
     ] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuestionnaireUIText:
     """Configuration for UI text and internationalization.
 
@@ -121,10 +121,13 @@ class QuestionnaireUIText:
     question_counter: str = "### Vraag {current} van {total}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuestionnaireConfig:
     """Configuration for questionnaire behavior and appearance.
 
+    Frozen, so a single module-level config can be shared by the cached
+    questionnaire instances of every session.
+
     Attributes
     ----------
     session_prefix : str
@@ -152,6 +155,10 @@ class Question(ABC):
     Defines the interface that all question types must implement.
     """
 
+    # Whether the question can be rendered inside st.form; questions that need
+    # intermediate reruns or render their own buttons set this to False
+    form_compatible: bool = True
+
     def __init__(self, key: str, text: str, help_text: Optional[str] = None):
         """Initialize a question.
 
@@ -195,6 +202,19 @@ class Question(ABC):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def get_widget_value(self) -> Any:
+        """Get the value currently held by this question's widget.
+
+        Button callbacks run before the script body, so they cannot rely on
+        ``render`` having returned the latest input yet.
+
+        Returns
+        -------
+        Any
+            Widget value from session state, or None if not rendered yet
+        """
+        return st.session_state.get(f"input_{self.key}")
+
 
 class NumberQuestion(Question):
     """Number input question with validation and formatting.
@@ -442,6 +462,8 @@ class SelectWithCustomQuestion(Question):
     optional suggestions.
     """
 
+    form_compatible = False
+
     def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         key: str,
@@ -622,6 +644,14 @@ class SelectWithCustomQuestion(Question):
             st.session_state[custom_text_key] = ""
             return str(selection)
 
+    def get_widget_value(self) -> Any:
+        """Get the current selection, or the custom text when chosen."""
+        selection = st.session_state.get(f"select_{self.key}")
+        if selection == self.custom_option_label:
+            custom_text = str(st.session_state.get(f"custom_{self.key}", ""))
+            return custom_text if custom_text.strip() else ""
+        return selection
+
     def get_default_value(self) -> str:
         """Get default value."""
         return self.options[0] if self.options else ""
@@ -882,6 +912,42 @@ class DateQuestion(Question):
         return self.default_value
 
 
+def _form_submit_button(label: str, key: Optional[str] = None, **kwargs: Any) -> bool:
+    """Create a form submit button, accepting the ``key`` of ``st.button``.
+
+    Submit buttons are told apart by their label within their form, and
+    ``st.form_submit_button`` only accepts a ``key`` on newer Streamlit
+    releases than the supported minimum, so the key is dropped.
+    """
+    del key
+    return bool(st.form_submit_button(label, **kwargs))
+
+
+def question_form(question: Question, form_key: str) -> Tuple[Any, Callable[..., bool]]:
+    """Get the container and button function for a question's input block.
+
+    Form-compatible questions render inside ``st.form`` so edits are batched
+    into the navigation click instead of rerunning on every change. Questions
+    that need intermediate reruns (for example to show a custom text field)
+    fall back to a plain container with regular buttons.
+
+    Parameters
+    ----------
+    question : Question
+        Question that will be rendered in the block
+    form_key : str
+        Unique key for the form
+
+    Returns
+    -------
+    Tuple[Any, Callable[..., bool]]
+        Context manager for the block and the button function to use in it
+    """
+    if question.form_compatible:
+        return st.form(key=form_key), _form_submit_button
+    return st.container(), st.button
+
+
 class Questionnaire:
     """Interactive step-by-step questionnaire with navigation and state management.
 
@@ -1166,10 +1232,8 @@ class Questionnaire:
 
     def reset(self) -> None:
         """Reset questionnaire to initial state."""
-        if self.step_key in st.session_state:
-            del st.session_state[self.step_key]
-        if self.data_key in st.session_state:
-            del st.session_state[self.data_key]
+        st.session_state.pop(self.step_key, None)
+        st.session_state.pop(self.data_key, None)
 
     def is_complete(self) -> bool:
         """Check if questionnaire is completed."""
@@ -1235,17 +1299,29 @@ class Questionnaire:
         if question.help_text:
             st.caption(f"💡 {question.help_text}")
 
-        current_value = question.render(stored_data.get(question.key))
+        # Render the question and its navigation as one (form) block
+        form, nav_button = question_form(
+            question, f"{self.config.session_prefix}_{self.name}_form_{current_step}"
+        )
+        with form:
+            current_value = question.render(stored_data.get(question.key))
 
-        # Enhanced navigation with jump-to buttons
-        self._render_enhanced_navigation(current_step, current_value)
+            # Enhanced navigation with jump-to buttons
+            self._render_enhanced_navigation(current_step, current_value, nav_button)
 
         return None
 
     def _render_enhanced_navigation(
-        self, current_step: int, current_value: Any
+        self,
+        current_step: int,
+        current_value: Any,
+        nav_button: Callable[..., bool] = st.button,
     ) -> bool:
-        """Render enhanced navigation with jump-to capabilities."""
+        """Render enhanced navigation with jump-to capabilities.
+
+        ``nav_button`` creates the buttons; pass the button function returned
+        by ``question_form`` when the navigation is rendered inside its block.
+        """
         total_steps = len(self.questions)
         question = self.questions[current_step]
 
@@ -1255,7 +1331,7 @@ class Questionnaire:
         # Jump to first question
         with nav_cols[0]:
             if current_step > 0:
-                if st.button(
+                if nav_button(
                     "⏮️ Eerste",
                     key=f"first_{current_step}",
                     help="Ga naar de eerste vraag",
@@ -1267,14 +1343,9 @@ class Questionnaire:
         # Previous button
         with nav_cols[1]:
             if current_step > 0:
-                if display_calculation_button is not None:
-                    clicked = display_calculation_button(
-                        label="⬅️ Vorige",
-                        key=f"prev_{current_step}",
-                        button_type="secondary",
-                    )
-                else:
-                    clicked = st.button("⬅️ Vorige", key=f"prev_{current_step}")
+                clicked = nav_button(
+                    "⬅️ Vorige", key=f"prev_{current_step}", type="secondary"
+                )
 
                 if clicked:
                     self._store_answer(question.key, current_value)
@@ -1292,12 +1363,7 @@ class Questionnaire:
                 button_key = f"complete_{current_step}"
                 button_type = "primary"
 
-            if display_calculation_button is not None:
-                clicked = display_calculation_button(
-                    label=button_text, key=button_key, button_type=button_type
-                )
-            else:
-                clicked = st.button(button_text, key=button_key, type="primary")
+            clicked = nav_button(button_text, key=button_key, type=button_type)
 
             if clicked:
                 self._store_answer(question.key, current_value)
@@ -1313,7 +1379,7 @@ class Questionnaire:
         # Jump to last question
         with nav_cols[3]:
             if current_step < total_steps - 1:
-                if st.button(
+                if nav_button(
                     "⏭️ Laatste",
                     key=f"last_{current_step}",
                     help="Ga naar de laatste vraag",
@@ -1332,7 +1398,7 @@ class Questionnaire:
             for i in range(min(total_steps, 8)):
                 with jump_cols[i]:
                     if i != current_step:
-                        if st.button(
+                        if nav_button(
                             f"{i + 1}",
                             key=f"jump_{current_step}_{i}",
                             use_container_width=True,
@@ -53,6 +53,7 @@ __all__ = [
     # Display components
     "display_section_header",
     "display_financial_metrics",
+    "display_metric_row",
     "display_info_card",
     # Input components
     "display_currency_input",
@@ -8,6 +8,7 @@ Components
 ----------
 - display_section_header: Consistent section headers with icons
 - display_financial_metrics: Financial metrics in formatted columns
+- display_metric_row: Pre-formatted metrics in equal-width columns
 - display_info_card: Information cards with styling and icons
 
 Dependencies
@@ -16,7 +17,7 @@ Dependencies
 - typing: Type hints
 """
 
-from typing import List, Optional, Tuple
+from typing import List, Literal, Optional, Sequence, Tuple
 
 import streamlit as st
 
@@ -84,6 +85,44 @@ def display_financial_metrics(
                 st.metric(label, f"€{value:,.2f}")
 
 
+def display_metric_row(
+    metrics: Sequence[
+        Tuple[str, str, Optional[str], Literal["normal", "inverse", "off"]]
+    ],
+) -> None:
+    """Display a row of already formatted metrics in equal-width columns.
+
+    Unlike display_financial_metrics the values are shown as given, so
+    callers can format them once (or cache the formatted rows) and can show
+    values that are not amounts.
+
+    Parameters
+    ----------
+    metrics : Sequence[Tuple[str, str, Optional[str], Literal[...]]]
+        Metric tuples containing:
+        - label: Metric name/description (e.g., "Eindbedrag")
+        - value: Formatted value to display (e.g., "€10,000.00")
+        - delta: Optional delta text for metric (e.g., "Positief saldo")
+        - delta_color: Delta color ("normal", "inverse" or "off")
+
+    Example
+    -------
+    >>> display_metric_row(
+    ...     [
+    ...         ("Eindbedrag", "€130,825.25", None, "normal"),
+    ...         ("Totaal ingelegd", "€37,000.00", None, "normal"),
+    ...     ]
+    ... )
+    """
+    if not metrics:
+        return
+
+    for column, (label, value, delta, delta_color) in zip(
+        st.columns(len(metrics)), metrics
+    ):
+        column.metric(label, value, delta=delta, delta_color=delta_color)
+
+
 def display_info_card(
     title: str, content: str, icon: str = "💡", card_type: str = "info"
 ) -> None:
@@ -132,4 +171,9 @@ def display_info_card(
         st.error(content_with_icon)
 
 
-__all__ = ["display_section_header", "display_financial_metrics", "display_info_card"]
+__all__ = [
+    "display_section_header",
+    "display_financial_metrics",
+    "display_metric_row",
+    "display_info_card",
+]
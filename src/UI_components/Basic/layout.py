@@ -16,7 +16,7 @@ Dependencies
 - typing: Type hints
 """
 
-from typing import Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 import streamlit as st
 
@@ -277,7 +277,7 @@ def display_category_navigation(
 
 
 def display_question_navigation(
-    questions: list,
+    questions: Sequence[Any],
     current_question_idx: int,
     category_name: str,
     navigation_key: str = "question_nav",
@@ -289,8 +289,8 @@ def display_question_navigation(
 
     Parameters
     ----------
-    questions : list
-        List of question objects
+    questions : Sequence[Any]
+        Question objects in display order
     current_question_idx : int
         Index of currently active question
     category_name : str
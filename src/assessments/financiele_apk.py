@@ -31,17 +31,35 @@ are assumed to be in Euros (€). The simple mode includes validation
 to ensure input consistency.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from collections import ChainMap
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 import plotly.graph_objects as go
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 
-from src.data.doel_suggesties import FINANCIELE_DOEL_SUGGESTIES
+from src.data.doel_suggesties import (
+    FINANCIELE_DOEL_OPTIES,
+    FINANCIELE_DOEL_SUGGESTIES,
+)
 from src.database.models import Asset, Liability, MonthlyFlow
 from src.UI_components.Applied.questionnaire import (
     BooleanQuestion,
-    MultiSelectQuestion,
     NumberQuestion,
     Question,
     Questionnaire,
@@ -49,21 +67,80 @@ from src.UI_components.Applied.questionnaire import (
     SelectQuestion,
     SelectWithCustomQuestion,
     TextQuestion,
+    question_form,
 )
 from src.UI_components.Basic import (
     display_calculation_button,
     display_info_card,
+    display_metric_row,
     display_progress_indicator,
     display_section_header,
 )
-from src.UI_components.Basic.layout import (
-    display_category_navigation,
-    display_question_navigation,
-    display_two_column_layout,
+from src.UI_components.Basic.layout import display_question_navigation
+
+# Column width ratios for the category navigation rows
+_NAV_COLS: Tuple[int, ...] = (1, 1, 1, 1)  # Question and category navigation
+_SKIP_COLS: Tuple[int, ...] = (1, 2, 1)  # Centered skip-category button
+
+
+# Answer values that drive conditional questions. Interned so the equality
+# checks in visibility evaluation can short-circuit on identity.
+_HUUR = sys.intern("Huur")
+_KOOP = sys.intern("Koop")
+_SAMENWONEND = sys.intern("Samenwonend")
+_GETROUWD = sys.intern("Getrouwd")
+
+# Goal choices for the optional second goal, with an empty "no goal" entry
+_OPTIONAL_DOEL_OPTIES: Tuple[str, ...] = ("",) + FINANCIELE_DOEL_OPTIES
+
+# Priority levels offered for each financial goal
+_PRIORITEIT_OPTIES: Tuple[str, ...] = ("Hoog", "Middel", "Laag")
+
+# Debt types offered in the debt questions, in display order. Each of them is
+# followed up with amount and monthly payment questions.
+_SCHULD_TYPES: Tuple[str, ...] = (
+    "Studieschuld",
+    "Persoonlijke lening",
+    "Creditcard schuld",
+    "Doorlopend krediet",
+    "Auto financiering",
+    "Overige lening",
 )
+_SCHULD_TYPES_WITH_AMOUNT = frozenset(_SCHULD_TYPES)
+
+
+class _NavKeys(NamedTuple):
+    """Widget keys for the form and navigation buttons of one question."""
+
+    form: str
+    prev_question: str
+    next_question: str
+    complete_category: str
+    prev_category: str
+    next_category: str
+    skip_category: str
+
+
+@lru_cache(maxsize=128)
+def _nav_keys(category_name: str, question_idx: int) -> _NavKeys:
+    """Build the navigation widget keys once per category and question."""
+    return _NavKeys(
+        form=f"form_{category_name}_{question_idx}",
+        prev_question=f"prev_q_{category_name}_{question_idx}",
+        next_question=f"next_q_{category_name}_{question_idx}",
+        complete_category=f"complete_cat_{category_name}",
+        prev_category=f"goto_prev_cat_{category_name}",
+        next_category=f"goto_next_cat_{category_name}",
+        skip_category=f"skip_cat_{category_name}",
+    )
+
 
+# A distinct visibility condition: one question carrying it and the positions
+# of all questions in the category that share it
+_Condition = Tuple["ConditionalQuestion", Tuple[int, ...]]
 
-@dataclass
+
+@dataclass(slots=True)
 class QuestionCategory:
     """Represents a category of questions in the Financial APK.
 
@@ -77,15 +154,44 @@ class QuestionCategory:
         Emoji icon for the category
     questions : List[Question]
         List of questions in this category
+    conditions : List[Tuple[ConditionalQuestion, Tuple[int, ...]]]
+        One entry per distinct condition among the conditional questions: a
+        question carrying it and the positions of every question sharing it,
+        so each condition is evaluated once per visibility pass
+    dependents : Dict[str, List[Tuple[ConditionalQuestion, Tuple[int, ...]]]]
+        Maps each condition key to the entries of ``conditions`` that depend
+        on it; both are built once at construction time
     """
 
     name: str
     description: str
     icon: str
     questions: List[Question]
+    conditions: List[_Condition] = field(init=False, repr=False)
+    dependents: Dict[str, List[_Condition]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Group the conditional questions by the condition they share."""
+        groups: Dict[Tuple[str, Any], Tuple[ConditionalQuestion, List[int]]] = {}
+        for index, question in enumerate(self.questions):
+            if isinstance(question, ConditionalQuestion):
+                groups.setdefault(question.condition, (question, []))[1].append(index)
+
+        self.conditions = [
+            (question, tuple(indices)) for question, indices in groups.values()
+        ]
+        self.dependents = {}
+        for condition in self.conditions:
+            self.dependents.setdefault(condition[0].condition_key, []).append(condition)
+
+    def visible_questions(self, flags: Sequence[bool]) -> Tuple[Question, ...]:
+        """Return the questions whose visibility flag is set."""
+        return tuple(
+            question for question, shown in zip(self.questions, flags) if shown
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryProgress:
     """Tracks progress for a single category.
 
@@ -104,18 +210,14 @@ class CategoryProgress:
     category_name: str
     current_question: int = 0
     completed: bool = False
-    data: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.data is None:
-            self.data = {}
+    data: Dict[str, Any] = field(default_factory=dict)
 
 
 class CheckboxQuestion(Question):
-    """Multiple checkbox selection question.
+    """Multiple selection question.
 
-    Allows users to select multiple items from a list of options
-    using individual checkboxes for each option.
+    Allows users to select multiple items from a list of options using a
+    single multiselect widget.
     """
 
     def __init__(
@@ -135,7 +237,7 @@ class CheckboxQuestion(Question):
         text : str
             Question text to display
         options : List[str]
-            List of checkbox options
+            List of selectable options
         default_values : Optional[List[str]]
             List of initially selected options
         help_text : Optional[str]
@@ -146,21 +248,18 @@ class CheckboxQuestion(Question):
         self.default_values = default_values or []
 
     def render(self, current_value: Any = None) -> List[str]:
-        """Render checkbox widgets for each option."""
+        """Render a multiselect widget holding all options."""
         if current_value is None:
             current_value = self.default_values
-
-        st.write(self.text)
-        if self.help_text:
-            st.caption(self.help_text)
-
-        selected = []
-        for option in self.options:
-            is_checked = option in current_value
-            if st.checkbox(option, value=is_checked, key=f"{self.key}_{option}"):
-                selected.append(option)
-
-        return selected
+        selected = set(current_value)
+
+        return st.multiselect(
+            self.text,
+            options=self.options,
+            default=[option for option in self.options if option in selected],
+            help=self.help_text,
+            key=f"input_{self.key}",
+        )
 
     def get_default_value(self) -> List[str]:
         """Get default value."""
@@ -196,35 +295,58 @@ class ConditionalQuestion(Question):
         condition_key : str
             Key of the question/field to check
         condition_value : Any
-            Value that must match for this question to be shown
+            Value that must match for this question to be shown; a list or
+            set matches any of its members
         help_text : Optional[str]
             Optional help text
         """
         super().__init__(key, text, help_text)
         self.base_question = base_question
+        self.form_compatible = base_question.form_compatible
         self.condition_key = condition_key
         self.condition_value = condition_value
+        # Hashable form of the condition, shared by questions with the same one
+        self.condition = (
+            condition_key,
+            (
+                frozenset(condition_value)
+                if isinstance(condition_value, (list, set))
+                else condition_value
+            ),
+        )
+        self._predicate = self._build_predicate(condition_value)
 
-    def should_show(self, data: Dict[str, Any]) -> bool:
-        """Check if this question should be shown based on current data."""
-        current_value = data.get(self.condition_key)
-
+    @staticmethod
+    def _build_predicate(condition_value: Any) -> Callable[[Any], bool]:
+        """Pick the visibility test for a condition value once, at construction."""
         # Special case for text fields - show if field is not empty
-        if isinstance(self.condition_value, str) and self.condition_value == "":
-            return current_value is not None and str(current_value).strip() != ""
+        if isinstance(condition_value, str) and condition_value == "":
+            return lambda value: value is not None and str(value).strip() != ""
 
         # Handle different comparison types
-        if isinstance(self.condition_value, list):
-            return current_value in self.condition_value
-        elif isinstance(self.condition_value, str) and isinstance(current_value, list):
-            return self.condition_value in current_value
+        if isinstance(condition_value, (list, set, frozenset)):
+            return frozenset(condition_value).__contains__
+        elif isinstance(condition_value, str):
+            return lambda value: (
+                condition_value in value
+                if isinstance(value, list)
+                else value == condition_value
+            )
         else:
-            return current_value == self.condition_value
+            return lambda value: value == condition_value
+
+    def should_show(self, data: Mapping[str, Any]) -> bool:
+        """Check if this question should be shown based on current data."""
+        return self._predicate(data.get(self.condition_key))
 
     def render(self, current_value: Any = None) -> Any:
         """Render the base question."""
         return self.base_question.render(current_value)
 
+    def get_widget_value(self) -> Any:
+        """Get the widget value from the base question."""
+        return self.base_question.get_widget_value()
+
     def get_default_value(self) -> Any:
         """Get default value from base question."""
         return self.base_question.get_default_value()
@@ -258,12 +380,23 @@ class CategoricalQuestionnaire:
         self.categories = categories
         self.config = config or QuestionnaireConfig()
 
+        # Category name -> position, so name lookups don't scan the list
+        self._category_index = {
+            category.name: i for i, category in enumerate(categories)
+        }
+        self._total_questions = sum(len(category.questions) for category in categories)
+
         # Session state keys
         self.current_category_key = (
             f"{self.config.session_prefix}_{name}_current_category"
         )
         self.progress_key = f"{self.config.session_prefix}_{name}_progress"
         self.data_key = f"{self.config.session_prefix}_{name}_data"
+        self.visibility_key = f"{self.config.session_prefix}_{name}_visibility"
+        self.visible_key = f"{self.config.session_prefix}_{name}_visible_questions"
+        self.incomplete_key = f"{self.config.session_prefix}_{name}_incomplete"
+        self.in_stepmode_key = f"{name}_in_stepmode"
+        self.enter_stepmode_key = f"{name}_enter_stepmode"
 
     def _initialize_session_state(self) -> None:
         """Initialize session state for categorical questionnaire."""
@@ -287,30 +420,57 @@ class CategoricalQuestionnaire:
         st.session_state[self.current_category_key] = index
 
     def _get_progress(self) -> Dict[str, CategoryProgress]:
-        """Get progress for all categories."""
-        return dict(st.session_state.get(self.progress_key, {}))
+        """Get progress for all categories.
+
+        Returns the session state dict itself rather than a copy; callers
+        that need to change it go through ``_update_progress``.
+        """
+        return cast(
+            Dict[str, CategoryProgress], st.session_state.get(self.progress_key, {})
+        )
 
     def _update_progress(self, category_name: str, progress: CategoryProgress) -> None:
         """Update progress for a specific category."""
-        all_progress = self._get_progress()
-        all_progress[category_name] = progress
-        st.session_state[self.progress_key] = all_progress
+        st.session_state.setdefault(self.progress_key, {})[category_name] = progress
+        if progress.completed:
+            incomplete = self._get_incomplete()
+            index = self._category_index[category_name]
+            if index in incomplete:
+                incomplete.remove(index)
+
+    def _get_incomplete(self) -> List[int]:
+        """Get the positions of the categories that are not completed yet.
+
+        Kept in session state in category order and shrunk as categories are
+        completed, so lookups don't rescan the progress of every category.
+        """
+        incomplete = st.session_state.get(self.incomplete_key)
+        if incomplete is None:
+            progress_data = self._get_progress()
+            incomplete = [
+                i
+                for i, cat in enumerate(self.categories)
+                if not progress_data.get(cat.name, CategoryProgress(cat.name)).completed
+            ]
+            st.session_state[self.incomplete_key] = incomplete
+        return incomplete
 
     def _get_all_data(self) -> Dict[str, Any]:
-        """Get all collected data."""
-        return dict(st.session_state.get(self.data_key, {}))
+        """Get all collected data.
+
+        Returns the session state dict itself rather than a copy; callers
+        that need to change it go through ``_store_data``.
+        """
+        return cast(Dict[str, Any], st.session_state.get(self.data_key, {}))
 
     def _store_data(self, data: Dict[str, Any]) -> None:
         """Store collected data."""
-        all_data = self._get_all_data()
-        all_data.update(data)
-        st.session_state[self.data_key] = all_data
+        st.session_state.setdefault(self.data_key, {}).update(data)
 
     def _show_overall_progress(self) -> None:
         """Display overall progress across all categories."""
-        progress_data = self._get_progress()
-        completed_categories = sum(1 for p in progress_data.values() if p.completed)
         total_categories = len(self.categories)
+        completed_categories = total_categories - len(self._get_incomplete())
 
         overall_progress = (
             completed_categories / total_categories if total_categories > 0 else 0
@@ -324,12 +484,16 @@ class CategoricalQuestionnaire:
         )
 
     def _show_category_progress(
-        self, category: QuestionCategory, progress: CategoryProgress
+        self,
+        category: QuestionCategory,
+        progress: CategoryProgress,
+        total_questions: int,
     ) -> None:
-        """Display progress for current category."""
-        visible_questions = self._get_visible_questions(category, progress.data)
-        total_questions = len(visible_questions)
+        """Display progress for current category.
 
+        The caller passes the number of visible questions it already derived,
+        so the header does not re-evaluate question visibility.
+        """
         if total_questions > 0:
             category_progress = (progress.current_question + 1) / total_questions
             current_q = min(progress.current_question + 1, total_questions)
@@ -343,20 +507,83 @@ class CategoricalQuestionnaire:
 
     def _get_visible_questions(
         self, category: QuestionCategory, data: Dict[str, Any]
-    ) -> List[Question]:
-        """Get list of questions that should be visible based on current data."""
-        visible = []
-        all_data = self._get_all_data()
-        all_data.update(data)  # Include current category data
+    ) -> Tuple[Question, ...]:
+        """Get the questions that should be visible based on current data."""
+        visibility = st.session_state.setdefault(self.visibility_key, {})
+        flags = visibility.get(category.name)
+
+        if flags is None:
+            # Current category data takes precedence over the collected data
+            all_data = ChainMap(data, self._get_all_data())
+            flags = [True] * len(category.questions)
+            for question, indices in category.conditions:
+                shown = question.should_show(all_data)
+                for index in indices:
+                    flags[index] = shown
+            visibility[category.name] = flags
+
+        # Only the conditional questions can flip, so the visible questions
+        # are kept per category until its flags change
+        visible_cache = st.session_state.setdefault(self.visible_key, {})
+        key = tuple(flags)
+        cached = visible_cache.get(category.name)
+        if cached is None or cached[0] != key:
+            cached = (key, category.visible_questions(key))
+            visible_cache[category.name] = cached
+        return cast(Tuple[Question, ...], cached[1])
+
+    def _refresh_visibility(self, changed_key: str, data: Dict[str, Any]) -> None:
+        """Re-evaluate only the conditions that depend on a changed key."""
+        visibility = st.session_state.get(self.visibility_key, {})
+        for category in self.categories:
+            flags = visibility.get(category.name)
+            if flags is None:
+                continue
+            for question, indices in category.dependents.get(changed_key, ()):
+                shown = question.should_show(data)
+                for index in indices:
+                    flags[index] = shown
+
+    def _save_pending_answer(
+        self, progress: CategoryProgress, question: Question
+    ) -> None:
+        """Store a widget value that no render has auto-saved yet."""
+        value = question.get_widget_value()
+        if value is not None and value != progress.data.get(question.key):
+            progress.data[question.key] = value
+            self._store_data({question.key: value})
+            self._refresh_visibility(question.key, self._get_all_data())
+
+    def _on_question_nav(
+        self, category: QuestionCategory, question: Question, target_idx: int
+    ) -> None:
+        """Button callback: save the current answer and move to another question."""
+        progress = self._get_progress()[category.name]
+        self._save_pending_answer(progress, question)
+        progress.current_question = target_idx
 
-        for question in category.questions:
-            if isinstance(question, ConditionalQuestion):
-                if question.should_show(all_data):
-                    visible.append(question)
-            else:
-                visible.append(question)
+        # Moving past the last visible question completes the category. Count
+        # after saving, since the answer may reveal follow-up questions.
+        if target_idx >= len(self._get_visible_questions(category, progress.data)):
+            progress.completed = True
+
+        self._update_progress(category.name, progress)
 
-        return visible
+    def _on_category_nav(
+        self, category_name: str, question: Question, target_category_idx: int
+    ) -> None:
+        """Button callback: save the current answer and switch category."""
+        progress = self._get_progress()[category_name]
+        self._save_pending_answer(progress, question)
+        self._update_progress(category_name, progress)
+        self._set_current_category_index(target_category_idx)
+
+    def _on_skip_category(self, category_name: str, question: Question) -> None:
+        """Button callback: save the current answer and mark category complete."""
+        progress = self._get_progress()[category_name]
+        self._save_pending_answer(progress, question)
+        progress.completed = True
+        self._update_progress(category_name, progress)
 
     def _run_category(self, category: QuestionCategory) -> Optional[Dict[str, Any]]:
         """Run a single category questionnaire."""
@@ -382,7 +609,7 @@ class CategoricalQuestionnaire:
         st.write("---")
 
         # Show category progress
-        self._show_category_progress(category, progress)
+        self._show_category_progress(category, progress, len(visible_questions))
 
         current_question_idx = progress.current_question
 
@@ -392,58 +619,68 @@ class CategoricalQuestionnaire:
             self._update_progress(category.name, progress)
             return progress.data
 
-        # Render current question
-        question = visible_questions[current_question_idx]
-        current_value = question.render(progress.data.get(question.key))
-
-        # AUTO-SAVE: Only save if value changed and is not None
-        previous_value = progress.data.get(question.key)
-        if current_value is not None and current_value != previous_value:
-            progress.data[question.key] = current_value
-            self._update_progress(category.name, progress)
-            # Also save to global data immediately
-            self._store_data({question.key: current_value})
-
-        # Navigation buttons
-        col1, col2, col3 = st.columns([1, 1, 1])
-
-        # Previous button
-        with col1:
-            if current_question_idx > 0:
-                if st.button(
-                    "Vorige vraag", key=f"prev_q_{category.name}_{current_question_idx}"
-                ):
-                    # Data is already auto-saved above
-                    progress.current_question = max(0, current_question_idx - 1)
-                    self._update_progress(category.name, progress)
-                    st.rerun()
+        progress_dirty = False
 
-        # Next/Complete button
-        with col2:
-            if current_question_idx < len(visible_questions) - 1:
-                button_text = "Volgende vraag"
-                key = f"next_q_{category.name}_{current_question_idx}"
-            else:
-                button_text = "Voltooien categorie"
-                key = f"complete_cat_{category.name}"
-
-            if st.button(button_text, key=key, type="primary"):
-                # Data is already auto-saved above
-                progress.current_question = current_question_idx + 1
+        # Render current question inside a form so edits are batched into the
+        # navigation click instead of rerunning on every change
+        question = visible_questions[current_question_idx]
+        keys = _nav_keys(category.name, current_question_idx)
+        form, nav_button = question_form(question, keys.form)
+        with form:
+            current_value = question.render(progress.data.get(question.key))
+
+            # AUTO-SAVE: Only save if value changed and is not None. The progress
+            # write is deferred to a single update at the end of the render.
+            previous_value = progress.data.get(question.key)
+            if current_value is not None and current_value != previous_value:
+                progress.data[question.key] = current_value
+                progress_dirty = True
+                # Also save to global data immediately
+                self._store_data({question.key: current_value})
+                self._refresh_visibility(question.key, self._get_all_data())
+
+            # Navigation buttons: state changes happen in on_click callbacks, so
+            # the rerun after a click already shows the new question
+            col1, col2, col3 = st.columns([1, 1, 1])
+
+            # Previous button
+            with col1:
+                if current_question_idx > 0:
+                    nav_button(
+                        "Vorige vraag",
+                        key=keys.prev_question,
+                        on_click=self._on_question_nav,
+                        args=(category, question, max(0, current_question_idx - 1)),
+                    )
 
-                # Check if category is now complete
-                if progress.current_question >= len(visible_questions):
-                    progress.completed = True
+            # Next/Complete button
+            with col2:
+                if current_question_idx < len(visible_questions) - 1:
+                    button_text = "Volgende vraag"
+                    key = keys.next_question
+                else:
+                    button_text = "Voltooien categorie"
+                    key = keys.complete_category
+
+                nav_button(
+                    button_text,
+                    key=key,
+                    type="primary",
+                    on_click=self._on_question_nav,
+                    args=(category, question, current_question_idx + 1),
+                )
 
-                self._update_progress(category.name, progress)
-                st.rerun()
+            # Skip category button
+            with col3:
+                nav_button(
+                    "Sla categorie over",
+                    key=keys.skip_category,
+                    on_click=self._on_skip_category,
+                    args=(category.name, question),
+                )
 
-        # Skip category button
-        with col3:
-            if st.button("Sla categorie over", key=f"skip_cat_{category.name}"):
-                progress.completed = True
-                self._update_progress(category.name, progress)
-                st.rerun()
+        if progress_dirty:
+            self._update_progress(category.name, progress)
 
         # Return category data if completed, None if still in progress
         if progress.completed:
@@ -463,11 +700,7 @@ class CategoricalQuestionnaire:
 
         with col1:
             total_categories = len(self.categories)
-            completed_categories = sum(
-                1
-                for cat in self.categories
-                if progress_data.get(cat.name, CategoryProgress(cat.name)).completed
-            )
+            completed_categories = total_categories - len(self._get_incomplete())
             st.metric(
                 "Categorieën",
                 f"{completed_categories}/{total_categories}",
@@ -475,7 +708,7 @@ class CategoricalQuestionnaire:
             )
 
         with col2:
-            total_questions = sum(len(cat.questions) for cat in self.categories)
+            total_questions = self._total_questions
             answered_questions = sum(
                 len(progress_data.get(cat.name, CategoryProgress(cat.name)).data)
                 for cat in self.categories
@@ -538,7 +771,7 @@ class CategoricalQuestionnaire:
                         # Navigate to the category and switch to step-by-step mode
                         self._set_current_category_index(i)
                         # Store that we want to enter step-by-step mode for this category
-                        st.session_state[f"{self.name}_enter_stepmode"] = True
+                        st.session_state[self.enter_stepmode_key] = True
                         st.rerun()
 
                 # Show answered questions
@@ -554,25 +787,23 @@ class CategoricalQuestionnaire:
         col_actions = st.columns(3)  # Changed from 4 to 3 columns
 
         with col_actions[0]:
-            if st.button(
-                "🔄 Start opnieuw", type="secondary", use_container_width=True
-            ):
-                self.reset()
-                st.rerun()
+            # Reset in the click callback; the rerun triggered by the click
+            # then stays scoped to the enclosing APK fragment
+            st.button(
+                "🔄 Start opnieuw",
+                type="secondary",
+                use_container_width=True,
+                on_click=self.reset,
+            )
 
         with col_actions[1]:
             if not self.is_complete():
                 if st.button("▶️ Ga verder", type="primary", use_container_width=True):
-                    # Find first incomplete category and navigate to it
-                    for i, cat in enumerate(self.categories):
-                        if not progress_data.get(
-                            cat.name, CategoryProgress(cat.name)
-                        ).completed:
-                            self._set_current_category_index(i)
-                            # Store that we want to enter step-by-step mode
-                            st.session_state[f"{self.name}_enter_stepmode"] = True
-                            st.rerun()
-                            break
+                    # Navigate to the first incomplete category
+                    self._set_current_category_index(self._get_incomplete()[0])
+                    # Store that we want to enter step-by-step mode
+                    st.session_state[self.enter_stepmode_key] = True
+                    st.rerun()
 
         with col_actions[2]:
             if self.is_complete():
@@ -590,7 +821,7 @@ class CategoricalQuestionnaire:
         # Show back to overview button
         if st.button("⬅️ Terug naar overzicht", key="back_to_overview"):
             # Exit step-by-step mode
-            st.session_state[f"{self.name}_in_stepmode"] = False
+            st.session_state[self.in_stepmode_key] = False
             st.rerun()
 
         st.write("---")
@@ -631,52 +862,53 @@ class CategoricalQuestionnaire:
         current_category_idx = self._get_current_category_index()
 
         # Run current category with simple navigation
-        category = self.categories[current_category_idx]
+        self._run_category_fragment(self.categories[current_category_idx])
+        return None
+
+    @st.fragment
+    def _run_category_fragment(self, category: QuestionCategory) -> None:
+        """Render the active category as a fragment.
+
+        Navigation clicks inside the category only rerun this fragment; once the
+        category is completed a full app rerun advances step-by-step mode.
+        """
         category_data = self._run_category(category)
 
         if category_data is not None:
             # Category completed, store data and move to next
             self._store_data(category_data)
 
-            # Find next incomplete category
-            next_category_idx = None
-            progress_data = self._get_progress()
-            for i, cat in enumerate(self.categories):
-                if not progress_data[cat.name].completed:
-                    next_category_idx = i
-                    break
-
-            if next_category_idx is not None:
-                self._set_current_category_index(next_category_idx)
+            # Move on to the first incomplete category
+            incomplete = self._get_incomplete()
+            if incomplete:
+                self._set_current_category_index(incomplete[0])
                 st.rerun()
             else:
                 # All categories completed, exit step-by-step mode and go back to overview
-                st.session_state[f"{self.name}_in_stepmode"] = False
+                st.session_state[self.in_stepmode_key] = False
                 st.rerun()
 
-        return None
-
     def navigate_to_category(self, category_name: str) -> None:
         """Navigate directly to a specific category by name."""
-        for i, category in enumerate(self.categories):
-            if category.name == category_name:
-                self._set_current_category_index(i)
-                break
+        index = self._category_index.get(category_name)
+        if index is not None:
+            self._set_current_category_index(index)
 
     def navigate_to_question(self, category_name: str, question_key: str) -> None:
         """Navigate directly to a specific question within a category."""
+        index = self._category_index.get(category_name)
+        if index is None:
+            return
+
         # First navigate to the category
-        self.navigate_to_category(category_name)
+        self._set_current_category_index(index)
 
         # Then find the question index
-        for category in self.categories:
-            if category.name == category_name:
-                for i, question in enumerate(category.questions):
-                    if question.key == question_key:
-                        progress = self._get_progress()[category_name]
-                        progress.current_question = i
-                        self._update_progress(category_name, progress)
-                        break
+        for i, question in enumerate(self.categories[index].questions):
+            if question.key == question_key:
+                progress = self._get_progress()[category_name]
+                progress.current_question = i
+                self._update_progress(category_name, progress)
                 break
 
     def get_completion_summary(self) -> Dict[str, Any]:
@@ -722,26 +954,27 @@ class CategoricalQuestionnaire:
 
     def reset(self) -> None:
         """Reset the entire questionnaire."""
-        keys_to_remove = [
+        for key in (
             self.current_category_key,
             self.progress_key,
             self.data_key,
-            f"{self.name}_in_stepmode",
-            f"{self.name}_enter_stepmode",
-        ]
-        for key in keys_to_remove:
-            if key in st.session_state:
-                del st.session_state[key]
+            self.visibility_key,
+            self.visible_key,
+            self.incomplete_key,
+            self.in_stepmode_key,
+            self.enter_stepmode_key,
+        ):
+            st.session_state.pop(key, None)
 
     def is_complete(self) -> bool:
         """Check if all categories are completed."""
-        progress_data = self._get_progress()
-        return all(progress.completed for progress in progress_data.values())
+        return not self._get_incomplete()
 
     def get_data(self) -> Optional[Dict[str, Any]]:
         """Get all collected data if questionnaire is complete."""
         if self.is_complete():
-            return self._get_all_data()
+            # Hand out a copy so later edits to the session data don't leak
+            return dict(self._get_all_data())
         return None
 
     def run(self) -> Optional[Dict[str, Any]]:
@@ -749,15 +982,14 @@ class CategoricalQuestionnaire:
         self._initialize_session_state()
 
         # Check if we should enter step-by-step mode for a specific category
-        if st.session_state.get(f"{self.name}_enter_stepmode", False):
-            # Clear the flag and set persistent step mode
-            del st.session_state[f"{self.name}_enter_stepmode"]
-            st.session_state[f"{self.name}_in_stepmode"] = True
+        if st.session_state.pop(self.enter_stepmode_key, False):
+            # Flag cleared by the pop; set persistent step mode
+            st.session_state[self.in_stepmode_key] = True
             # Run the step-by-step mode for the current category
             return self._run_step_by_step_mode()
 
         # Check if we're already in step-by-step mode
-        elif st.session_state.get(f"{self.name}_in_stepmode", False):
+        elif st.session_state.get(self.in_stepmode_key, False):
             # Continue in step-by-step mode
             return self._run_step_by_step_mode()
 
@@ -785,7 +1017,7 @@ class CategoricalQuestionnaire:
             return {}
 
         # Show category header
-        self._show_category_progress(category, progress)
+        self._show_category_progress(category, progress, len(visible_questions))
 
         current_question_idx = min(
             progress.current_question, len(visible_questions) - 1
@@ -816,95 +1048,98 @@ class CategoricalQuestionnaire:
             f"❓ Vraag {current_question_idx + 1} van {len(visible_questions)}"
         )
 
-        # Render the question
-        current_value = progress.data.get(question.key, question.get_default_value())
-        answer = question.render(current_value)
-
-        # AUTO-SAVE: Always save current answer to both category progress and global data
-        if answer is not None:
-            progress.data[question.key] = answer
-            self._update_progress(category.name, progress)
-            # Also save to global data immediately
-            self._store_data({question.key: answer})
-
-        # Enhanced navigation buttons
-        col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-
-        # Previous question button
-        with col1:
-            if current_question_idx > 0:
-                if st.button(
-                    "⬅️ Vorige vraag",
-                    key=f"prev_q_{category.name}_{current_question_idx}",
-                ):
-                    # Data is already auto-saved above
-                    progress.current_question = current_question_idx - 1
-                    self._update_progress(category.name, progress)
-                    st.rerun()
-
-        # Next question button
-        with col2:
-            if current_question_idx < len(visible_questions) - 1:
-                button_text = "Volgende vraag ➡️"
-                key = f"next_q_{category.name}_{current_question_idx}"
-            else:
-                button_text = "Voltooien categorie ✅"
-                key = f"complete_cat_{category.name}"
+        progress_dirty = False
 
-            if st.button(button_text, key=key, type="primary"):
-                # Data is already auto-saved above
-                progress.current_question = current_question_idx + 1
-
-                # Check if category is now complete
-                if progress.current_question >= len(visible_questions):
-                    progress.completed = True
+        # Render the question and navigation inside a form so edits are batched
+        # into the navigation click instead of rerunning on every change
+        keys = _nav_keys(category.name, current_question_idx)
+        form, nav_button = question_form(question, keys.form)
+        with form:
+            current_value = progress.data.get(
+                question.key, question.get_default_value()
+            )
+            answer = question.render(current_value)
+
+            # AUTO-SAVE: Save changed answers to category progress and global data.
+            # The progress write is deferred to a single update at the end.
+            if answer is not None and answer != progress.data.get(question.key):
+                progress.data[question.key] = answer
+                progress_dirty = True
+                # Also save to global data immediately
+                self._store_data({question.key: answer})
+                self._refresh_visibility(question.key, self._get_all_data())
+
+            # Enhanced navigation buttons: state changes happen in on_click
+            # callbacks, so no explicit st.rerun() is needed after a click
+            current_cat_idx = self._get_current_category_index()
+            col1, col2, col3, col4 = st.columns(_NAV_COLS)
+
+            # Previous question button
+            with col1:
+                if current_question_idx > 0:
+                    nav_button(
+                        "⬅️ Vorige vraag",
+                        key=keys.prev_question,
+                        on_click=self._on_question_nav,
+                        args=(category, question, current_question_idx - 1),
+                    )
 
-                self._update_progress(category.name, progress)
-                st.rerun()
+            # Next question button
+            with col2:
+                if current_question_idx < len(visible_questions) - 1:
+                    button_text = "Volgende vraag ➡️"
+                    key = keys.next_question
+                else:
+                    button_text = "Voltooien categorie ✅"
+                    key = keys.complete_category
+
+                nav_button(
+                    button_text,
+                    key=key,
+                    type="primary",
+                    on_click=self._on_question_nav,
+                    args=(category, question, current_question_idx + 1),
+                )
 
-        # Jump to previous category button
-        with col3:
-            current_cat_idx = self._get_current_category_index()
-            if current_cat_idx > 0:
-                prev_category = self.categories[current_cat_idx - 1]
-                if st.button(
-                    f"⬅️ {prev_category.icon}",
-                    key=f"goto_prev_cat_{category.name}",
-                    help=f"Ga naar {prev_category.name}",
-                ):
-                    # Data is already auto-saved above
-                    self._update_progress(category.name, progress)
-                    self._set_current_category_index(current_cat_idx - 1)
-                    st.rerun()
+            # Jump to previous category button
+            with col3:
+                if current_cat_idx > 0:
+                    prev_category = self.categories[current_cat_idx - 1]
+                    nav_button(
+                        f"⬅️ {prev_category.icon}",
+                        key=keys.prev_category,
+                        help=f"Ga naar {prev_category.name}",
+                        on_click=self._on_category_nav,
+                        args=(category.name, question, current_cat_idx - 1),
+                    )
 
-        # Jump to next category button
-        with col4:
-            current_cat_idx = self._get_current_category_index()
-            if current_cat_idx < len(self.categories) - 1:
-                next_category = self.categories[current_cat_idx + 1]
-                if st.button(
-                    f"{next_category.icon} ➡️",
-                    key=f"goto_next_cat_{category.name}",
-                    help=f"Ga naar {next_category.name}",
-                ):
-                    # Data is already auto-saved above
-                    self._update_progress(category.name, progress)
-                    self._set_current_category_index(current_cat_idx + 1)
-                    st.rerun()
+            # Jump to next category button
+            with col4:
+                if current_cat_idx < len(self.categories) - 1:
+                    next_category = self.categories[current_cat_idx + 1]
+                    nav_button(
+                        f"{next_category.icon} ➡️",
+                        key=keys.next_category,
+                        help=f"Ga naar {next_category.name}",
+                        on_click=self._on_category_nav,
+                        args=(category.name, question, current_cat_idx + 1),
+                    )
 
         # Skip category button (moved to bottom)
         st.write("---")
-        col_skip1, col_skip2, col_skip3 = st.columns([1, 2, 1])
+        col_skip1, col_skip2, col_skip3 = st.columns(_SKIP_COLS)
         with col_skip2:
-            if st.button(
+            st.button(
                 "⏭️ Sla categorie over",
-                key=f"skip_cat_{category.name}",
+                key=keys.skip_category,
                 type="secondary",
                 use_container_width=True,
-            ):
-                progress.completed = True
-                self._update_progress(category.name, progress)
-                st.rerun()
+                on_click=self._on_skip_category,
+                args=(category.name, question),
+            )
+
+        if progress_dirty:
+            self._update_progress(category.name, progress)
 
         # Check if category is completed and return data if so
         if progress.completed:
@@ -913,609 +1148,546 @@ class CategoricalQuestionnaire:
         return None
 
 
-def create_comprehensive_financiele_apk_questionnaire() -> CategoricalQuestionnaire:
-    """Create the comprehensive categorical Financiele APK questionnaire.
-
-    Creates 8 categories of questions covering all aspects of personal finance:
-    - Persoonlijke situatie
-    - Woonsituatie
-    - Financiële producten
-    - Geordende zaken
-    - Bezittingen
-    - Schulden
-    - Inkomsten & uitgaven
-    - Doelen
-
-    Returns
-    -------
-    CategoricalQuestionnaire
-        Complete multi-category questionnaire
-    """
-    categories = []
-
-    # Category 1: Persoonlijke situatie
-    persoonlijk_questions = [
-        SelectQuestion(
-            key="relatievorm",
-            text="Wat is je relatievorm?",
-            options=[
-                "Alleenstaand",
-                "Samenwonend",
-                "Getrouwd",
-                "Gescheiden",
-                "Weduwe/weduwnaar",
-            ],
-            help_text="Selecteer je huidige relatiesituatie",
-        ),
-        NumberQuestion(
-            key="leeftijd",
-            text="Wat is je leeftijd?",
-            min_value=16,
-            max_value=100,
-            step=1,
-            format_str="%d",
-            help_text="Voer je leeftijd in jaren in",
+# Question categories of the comprehensive APK, built once at import. The
+# questionnaire only reads them, so every factory call can share them.
+
+# Category 1: Persoonlijke situatie
+_PERSOONLIJK_QUESTIONS: List[Question] = [
+    SelectQuestion(
+        key="relatievorm",
+        text="Wat is je relatievorm?",
+        options=(
+            "Alleenstaand",
+            _SAMENWONEND,
+            _GETROUWD,
+            "Gescheiden",
+            "Weduwe/weduwnaar",
         ),
-        ConditionalQuestion(
+        help_text="Selecteer je huidige relatiesituatie",
+    ),
+    NumberQuestion(
+        key="leeftijd",
+        text="Wat is je leeftijd?",
+        min_value=16,
+        max_value=100,
+        step=1,
+        format_str="%d",
+        help_text="Voer je leeftijd in jaren in",
+    ),
+    ConditionalQuestion(
+        key="partner_leeftijd",
+        text="Wat is de leeftijd van je partner?",
+        base_question=NumberQuestion(
             key="partner_leeftijd",
             text="Wat is de leeftijd van je partner?",
-            base_question=NumberQuestion(
-                key="partner_leeftijd",
-                text="Wat is de leeftijd van je partner?",
-                min_value=16,
-                max_value=100,
-                step=1,
-                format_str="%d",
-                help_text="Voer de leeftijd van je partner in jaren in",
-            ),
-            condition_key="relatievorm",
-            condition_value=["Samenwonend", "Getrouwd"],
-        ),
-        NumberQuestion(
-            key="aantal_kinderen",
-            text="Hoeveel kinderen heb je?",
-            min_value=0,
-            max_value=20,
+            min_value=16,
+            max_value=100,
             step=1,
             format_str="%d",
-            help_text="Voer het aantal kinderen in (0 als je geen kinderen hebt)",
+            help_text="Voer de leeftijd van je partner in jaren in",
         ),
-    ]
-
-    categories.append(
-        QuestionCategory(
-            name="Persoonlijke situatie",
-            description="Basis informatie over jezelf en je gezinssituatie",
-            icon="👤",
-            questions=persoonlijk_questions,
-        )
-    )
+        condition_key="relatievorm",
+        condition_value=[_SAMENWONEND, _GETROUWD],
+    ),
+    NumberQuestion(
+        key="aantal_kinderen",
+        text="Hoeveel kinderen heb je?",
+        min_value=0,
+        max_value=20,
+        step=1,
+        format_str="%d",
+        help_text="Voer het aantal kinderen in (0 als je geen kinderen hebt)",
+    ),
+]
+
+_PERSOONLIJK_CATEGORY = QuestionCategory(
+    name="Persoonlijke situatie",
+    description="Basis informatie over jezelf en je gezinssituatie",
+    icon="👤",
+    questions=_PERSOONLIJK_QUESTIONS,
+)
 
-    # Category 2: Woonsituatie
-    woning_questions = [
-        SelectQuestion(
-            key="woon_situatie",
-            text="Wat is je woonsituatie?",
-            options=["Huur", "Koop", "Bij ouders/familie", "Anders"],
-            help_text="Selecteer hoe je woont",
-        ),
-        ConditionalQuestion(
+# Category 2: Woonsituatie
+_WONING_QUESTIONS: List[Question] = [
+    SelectQuestion(
+        key="woon_situatie",
+        text="Wat is je woonsituatie?",
+        options=(_HUUR, _KOOP, "Bij ouders/familie", "Anders"),
+        help_text="Selecteer hoe je woont",
+    ),
+    ConditionalQuestion(
+        key="maandelijkse_huur",
+        text="Wat betaal je maandelijks aan huur?",
+        base_question=NumberQuestion(
             key="maandelijkse_huur",
-            text="Wat betaal je maandelijks aan huur?",
-            base_question=NumberQuestion(
-                key="maandelijkse_huur",
-                text="Wat betaal je maandelijks aan huur? (€)",
-                min_value=0,
-                step=50,
-                help_text="Voer je maandelijkse huurkosten in euro's in",
-            ),
-            condition_key="woon_situatie",
-            condition_value="Huur",
+            text="Wat betaal je maandelijks aan huur? (€)",
+            min_value=0,
+            step=50,
+            help_text="Voer je maandelijkse huurkosten in euro's in",
         ),
-        ConditionalQuestion(
+        condition_key="woon_situatie",
+        condition_value=_HUUR,
+    ),
+    ConditionalQuestion(
+        key="woningwaarde",
+        text="Wat is de huidige waarde van je woning?",
+        base_question=NumberQuestion(
             key="woningwaarde",
-            text="Wat is de huidige waarde van je woning?",
-            base_question=NumberQuestion(
-                key="woningwaarde",
-                text="Wat is de huidige waarde van je woning? (€)",
-                min_value=0,
-                step=1000,
-                help_text="Geschatte marktwaarde van je woning",
-            ),
-            condition_key="woon_situatie",
-            condition_value="Koop",
+            text="Wat is de huidige waarde van je woning? (€)",
+            min_value=0,
+            step=1000,
+            help_text="Geschatte marktwaarde van je woning",
         ),
-        ConditionalQuestion(
+        condition_key="woon_situatie",
+        condition_value=_KOOP,
+    ),
+    ConditionalQuestion(
+        key="hypotheekbedrag",
+        text="Wat is het resterende hypotheekbedrag?",
+        base_question=NumberQuestion(
             key="hypotheekbedrag",
-            text="Wat is het resterende hypotheekbedrag?",
-            base_question=NumberQuestion(
-                key="hypotheekbedrag",
-                text="Wat is het resterende hypotheekbedrag? (€)",
-                min_value=0,
-                step=1000,
-                help_text="Het bedrag dat je nog moet afbetalen op je hypotheek",
-            ),
-            condition_key="woon_situatie",
-            condition_value="Koop",
+            text="Wat is het resterende hypotheekbedrag? (€)",
+            min_value=0,
+            step=1000,
+            help_text="Het bedrag dat je nog moet afbetalen op je hypotheek",
         ),
-        ConditionalQuestion(
+        condition_key="woon_situatie",
+        condition_value=_KOOP,
+    ),
+    ConditionalQuestion(
+        key="hypotheek_maandlasten",
+        text="Wat zijn je maandelijkse hypotheeklasten?",
+        base_question=NumberQuestion(
             key="hypotheek_maandlasten",
-            text="Wat zijn je maandelijkse hypotheeklasten?",
-            base_question=NumberQuestion(
-                key="hypotheek_maandlasten",
-                text="Wat zijn je maandelijkse hypotheeklasten? (€)",
-                min_value=0,
-                step=50,
-                help_text="Totale maandelijkse kosten hypotheek inclusief rente en aflossing",
-            ),
-            condition_key="woon_situatie",
-            condition_value="Koop",
+            text="Wat zijn je maandelijkse hypotheeklasten? (€)",
+            min_value=0,
+            step=50,
+            help_text="Totale maandelijkse kosten hypotheek inclusief rente en aflossing",
         ),
-        ConditionalQuestion(
+        condition_key="woon_situatie",
+        condition_value=_KOOP,
+    ),
+    ConditionalQuestion(
+        key="hypotheek_rente",
+        text="Wat is het rentepercentage van je hypotheek?",
+        base_question=NumberQuestion(
             key="hypotheek_rente",
-            text="Wat is het rentepercentage van je hypotheek?",
-            base_question=NumberQuestion(
-                key="hypotheek_rente",
-                text="Wat is het rentepercentage van je hypotheek? (%)",
-                min_value=0,
-                max_value=20,
-                step=0.1,
-                help_text="Het huidige rentepercentage van je hypotheek",
-            ),
-            condition_key="woon_situatie",
-            condition_value="Koop",
+            text="Wat is het rentepercentage van je hypotheek? (%)",
+            min_value=0,
+            max_value=20,
+            step=0.1,
+            help_text="Het huidige rentepercentage van je hypotheek",
         ),
-    ]
+        condition_key="woon_situatie",
+        condition_value=_KOOP,
+    ),
+]
+
+_WONING_CATEGORY = QuestionCategory(
+    name="Woonsituatie",
+    description="Informatie over je woning en woonkosten",
+    icon="🏠",
+    questions=_WONING_QUESTIONS,
+)
 
-    categories.append(
-        QuestionCategory(
-            name="Woonsituatie",
-            description="Informatie over je woning en woonkosten",
-            icon="🏠",
-            questions=woning_questions,
-        )
-    )
+# Category 3: Financiële producten
+_FINANCIELE_PRODUCTEN_QUESTIONS: List[Question] = [
+    CheckboxQuestion(
+        key="financiele_producten",
+        text="Welke financiële producten heb je?",
+        options=[
+            "Hypotheek",
+            "Aansprakelijkheidsverzekering",
+            "Inboedelverzekering",
+            "Levensverzekering",
+            "Beleggingsrekening",
+            "Pensioenregeling (werkgever)",
+            "Pensioenbeleggingsrekening",
+            "Zorgverzekering",
+            "Autoverzekering",
+            "Reisverzekering",
+        ],
+        help_text="Selecteer alle producten die je hebt",
+    ),
+    TextQuestion(
+        key="overige_financiele_producten",
+        text="Andere financiële producten die je hebt:",
+        placeholder="Bijvoorbeeld: specifieke verzekeringen, andere beleggingen...",
+        help_text="Vul eventuele andere financiële producten in die niet in de lijst stonden",
+    ),
+]
+
+_FINANCIELE_PRODUCTEN_CATEGORY = QuestionCategory(
+    name="Financiële producten",
+    description="Overzicht van je verzekeringen en financiële diensten",
+    icon="📋",
+    questions=_FINANCIELE_PRODUCTEN_QUESTIONS,
+)
 
-    # Category 3: Financiële producten
-    financiele_producten_questions = [
-        CheckboxQuestion(
-            key="financiele_producten",
-            text="Welke financiële producten heb je?",
-            options=[
-                "Hypotheek",
-                "Aansprakelijkheidsverzekering",
-                "Inboedelverzekering",
-                "Levensverzekering",
-                "Beleggingsrekening",
-                "Pensioenregeling (werkgever)",
-                "Pensioenbeleggingsrekening",
-                "Zorgverzekering",
-                "Autoverzekering",
-                "Reisverzekering",
-            ],
-            help_text="Selecteer alle producten die je hebt",
-        ),
-        TextQuestion(
-            key="overige_financiele_producten",
-            text="Andere financiële producten die je hebt:",
-            placeholder="Bijvoorbeeld: specifieke verzekeringen, andere beleggingen...",
-            help_text="Vul eventuele andere financiële producten in die niet in de lijst stonden",
-        ),
-    ]
+# Category 4: Geordende zaken
+_GEORDENDE_ZAKEN_QUESTIONS: List[Question] = [
+    BooleanQuestion(
+        key="heeft_testament",
+        text="Heb je een testament?",
+        help_text="Een testament regelt wat er met je bezittingen gebeurt na overlijden",
+    ),
+    BooleanQuestion(
+        key="pensioenopbouw_actief",
+        text="Bouw je actief pensioen op?",
+        help_text="Dit kan via je werkgever of een eigen pensioenregeling zijn",
+    ),
+    BooleanQuestion(
+        key="heeft_volmacht",
+        text="Heb je volmachten of andere juridische documenten geregeld?",
+        help_text="Bijvoorbeeld een levenstestament, volmacht voor financiële zaken, etc.",
+    ),
+]
+
+_GEORDENDE_ZAKEN_CATEGORY = QuestionCategory(
+    name="Geordende zaken",
+    description="Juridische en administratieve zaken",
+    icon="📄",
+    questions=_GEORDENDE_ZAKEN_QUESTIONS,
+)
 
-    categories.append(
-        QuestionCategory(
-            name="Financiële producten",
-            description="Overzicht van je verzekeringen en financiële diensten",
-            icon="📋",
-            questions=financiele_producten_questions,
-        )
-    )
+# Category 5: Bezittingen
+_BEZITTINGEN_QUESTIONS: List[Question] = [
+    NumberQuestion(
+        key="spaarsaldo",
+        text="Wat is je totale spaarsaldo? (€)",
+        min_value=0,
+        step=500,
+        help_text="Totaal spaargeld op alle spaarrekeningen",
+    ),
+    TextQuestion(
+        key="auto_merk",
+        text="Welk automerk/model heb je?",
+        placeholder="Bijvoorbeeld: Toyota Yaris, BMW X3...",
+        help_text="Laat leeg als je geen auto hebt",
+    ),
+    NumberQuestion(
+        key="auto_waarde",
+        text="Wat is de geschatte waarde van je auto? (€)",
+        min_value=0,
+        step=500,
+        help_text="Huidige marktwaarde van je auto (0 als je geen auto hebt)",
+    ),
+    NumberQuestion(
+        key="beleggingen_waarde",
+        text="Wat is de totale waarde van je beleggingen? (€)",
+        min_value=0,
+        step=500,
+        help_text="Aandelen, obligaties, ETFs, crypto, etc.",
+    ),
+    TextQuestion(
+        key="overige_bezittingen",
+        text="Andere waardevolle bezittingen:",
+        placeholder="Bijvoorbeeld: sieraden, kunst, verzamelingen...",
+        help_text="Bezittingen met aanzienlijke waarde die je wilt meenemen",
+    ),
+    NumberQuestion(
+        key="overige_bezittingen_waarde",
+        text="Geschatte waarde overige bezittingen (€)",
+        min_value=0,
+        step=500,
+        help_text="Totale geschatte waarde van je overige bezittingen",
+    ),
+]
+
+_BEZITTINGEN_CATEGORY = QuestionCategory(
+    name="Bezittingen",
+    description="Overzicht van je vermogen en waardevolle spullen",
+    icon="💰",
+    questions=_BEZITTINGEN_QUESTIONS,
+)
 
-    # Category 4: Geordende zaken
-    geordende_zaken_questions = [
-        BooleanQuestion(
-            key="heeft_testament",
-            text="Heb je een testament?",
-            help_text="Een testament regelt wat er met je bezittingen gebeurt na overlijden",
+# Category 6: Schulden
+_SCHULDEN_QUESTIONS: List[Question] = [
+    SelectQuestion(
+        key="schuld_type_1",
+        text="Welk type schuld heb je (eerste schuld)?",
+        options=("Geen schulden",) + _SCHULD_TYPES,
+        help_text="Selecteer je belangrijkste type schuld",
+    ),
+    ConditionalQuestion(
+        key="schuld_bedrag_1",
+        text="Wat is het totale bedrag van deze schuld?",
+        base_question=NumberQuestion(
+            key="schuld_bedrag_1",
+            text="Wat is het totale bedrag van deze schuld? (€)",
+            min_value=0,
+            step=100,
+            help_text="Het totale bedrag dat je nog moet afbetalen",
+        ),
+        condition_key="schuld_type_1",
+        condition_value=_SCHULD_TYPES_WITH_AMOUNT,
+    ),
+    ConditionalQuestion(
+        key="schuld_maandlasten_1",
+        text="Wat betaal je maandelijks af?",
+        base_question=NumberQuestion(
+            key="schuld_maandlasten_1",
+            text="Wat betaal je maandelijks af? (€)",
+            min_value=0,
+            step=25,
+            help_text="Maandelijkse aflossing van deze schuld",
         ),
-        BooleanQuestion(
-            key="pensioenopbouw_actief",
-            text="Bouw je actief pensioen op?",
-            help_text="Dit kan via je werkgever of een eigen pensioenregeling zijn",
+        condition_key="schuld_type_1",
+        condition_value=_SCHULD_TYPES_WITH_AMOUNT,
+    ),
+    # Second debt (optional)
+    SelectQuestion(
+        key="schuld_type_2",
+        text="Heb je nog een tweede type schuld?",
+        options=("Geen tweede schuld",) + _SCHULD_TYPES,
+        help_text="Optioneel: selecteer een tweede type schuld",
+    ),
+    ConditionalQuestion(
+        key="schuld_bedrag_2",
+        text="Wat is het totale bedrag van deze tweede schuld?",
+        base_question=NumberQuestion(
+            key="schuld_bedrag_2",
+            text="Wat is het totale bedrag van deze tweede schuld? (€)",
+            min_value=0,
+            step=100,
+            help_text="Het totale bedrag van je tweede schuld",
         ),
-        BooleanQuestion(
-            key="heeft_volmacht",
-            text="Heb je volmachten of andere juridische documenten geregeld?",
-            help_text="Bijvoorbeeld een levenstestament, volmacht voor financiële zaken, etc.",
+        condition_key="schuld_type_2",
+        condition_value=_SCHULD_TYPES_WITH_AMOUNT,
+    ),
+    ConditionalQuestion(
+        key="schuld_maandlasten_2",
+        text="Wat betaal je maandelijks af aan deze tweede schuld?",
+        base_question=NumberQuestion(
+            key="schuld_maandlasten_2",
+            text="Wat betaal je maandelijks af aan deze tweede schuld? (€)",
+            min_value=0,
+            step=25,
+            help_text="Maandelijkse aflossing van je tweede schuld",
         ),
-    ]
+        condition_key="schuld_type_2",
+        condition_value=_SCHULD_TYPES_WITH_AMOUNT,
+    ),
+]
+
+_SCHULDEN_CATEGORY = QuestionCategory(
+    name="Schulden",
+    description="Overzicht van je leningen en verplichtingen",
+    icon="📉",
+    questions=_SCHULDEN_QUESTIONS,
+)
 
-    categories.append(
-        QuestionCategory(
-            name="Geordende zaken",
-            description="Juridische en administratieve zaken",
-            icon="📄",
-            questions=geordende_zaken_questions,
-        )
-    )
+# Category 7: Inkomsten & uitgaven
+_INKOMSTEN_UITGAVEN_QUESTIONS: List[Question] = [
+    NumberQuestion(
+        key="primair_inkomen",
+        text="Wat is je primaire netto maandinkomen? (€)",
+        min_value=0,
+        step=100,
+        help_text="Je belangrijkste bron van inkomen (salaris, uitkering, etc.)",
+    ),
+    NumberQuestion(
+        key="bijinkomen",
+        text="Heb je bijkomende inkomsten per maand? (€)",
+        min_value=0,
+        step=50,
+        help_text="Freelance, huur, dividenden, etc. (0 als je geen bijinkomen hebt)",
+    ),
+    NumberQuestion(
+        key="vaste_lasten",
+        text="Wat zijn je totale vaste lasten per maand? (€)",
+        min_value=0,
+        step=50,
+        help_text="Huur/hypotheek, verzekeringen, abonnementen, telefoon, etc.",
+    ),
+    NumberQuestion(
+        key="energie_kosten",
+        text="Wat betaal je maandelijks aan energie? (€)",
+        min_value=0,
+        step=25,
+        help_text="Gas, water, licht",
+    ),
+    NumberQuestion(
+        key="variabele_kosten",
+        text="Wat geef je gemiddeld uit aan variabele kosten? (€)",
+        min_value=0,
+        step=50,
+        help_text="Boodschappen, kleding, entertainment, hobby's, etc.",
+    ),
+    NumberQuestion(
+        key="spaarritme",
+        text="Hoeveel denk je realistisch per maand te kunnen sparen/beleggen? (€)",
+        min_value=0,
+        step=25,
+        help_text="Het bedrag dat je maandelijks opzij kunt zetten",
+    ),
+]
+
+_INKOMSTEN_UITGAVEN_CATEGORY = QuestionCategory(
+    name="Inkomsten & uitgaven",
+    description="Je maandelijkse geldstromen",
+    icon="💳",
+    questions=_INKOMSTEN_UITGAVEN_QUESTIONS,
+)
 
-    # Category 5: Bezittingen
-    bezittingen_questions = [
-        NumberQuestion(
-            key="spaarsaldo",
-            text="Wat is je totale spaarsaldo? (€)",
+# Category 8: Doelen
+_DOELEN_QUESTIONS: List[Question] = [
+    SelectWithCustomQuestion(
+        key="doel_1_naam",
+        text="Wat is je (eerste) financiële doel?",
+        options=FINANCIELE_DOEL_OPTIES,
+        custom_option_label="Anders, namelijk:",
+        suggestions=FINANCIELE_DOEL_SUGGESTIES,
+        help_text="Kies je belangrijkste financiële doel of vul je eigen doel in",
+    ),
+    ConditionalQuestion(
+        key="doel_1_bedrag",
+        text="Hoeveel geld heb je hiervoor nodig?",
+        base_question=NumberQuestion(
+            key="doel_1_bedrag",
+            text="Hoeveel geld heb je hiervoor nodig? (€)",
             min_value=0,
             step=500,
-            help_text="Totaal spaargeld op alle spaarrekeningen",
-        ),
-        TextQuestion(
-            key="auto_merk",
-            text="Welk automerk/model heb je?",
-            placeholder="Bijvoorbeeld: Toyota Yaris, BMW X3...",
-            help_text="Laat leeg als je geen auto hebt",
+            help_text="Het totale bedrag dat je nodig hebt voor dit doel",
         ),
-        NumberQuestion(
-            key="auto_waarde",
-            text="Wat is de geschatte waarde van je auto? (€)",
+        condition_key="doel_1_naam",
+        condition_value="",  # Show if name is not empty
+    ),
+    ConditionalQuestion(
+        key="doel_1_huidig",
+        text="Hoeveel heb je hier al voor gespaard?",
+        base_question=NumberQuestion(
+            key="doel_1_huidig",
+            text="Hoeveel heb je hier al voor gespaard? (€)",
             min_value=0,
-            step=500,
-            help_text="Huidige marktwaarde van je auto (0 als je geen auto hebt)",
+            step=100,
+            help_text="Het bedrag dat je al hebt gespaard voor dit doel",
         ),
-        NumberQuestion(
-            key="beleggingen_waarde",
-            text="Wat is de totale waarde van je beleggingen? (€)",
-            min_value=0,
-            step=500,
-            help_text="Aandelen, obligaties, ETFs, crypto, etc.",
+        condition_key="doel_1_naam",
+        condition_value="",
+    ),
+    ConditionalQuestion(
+        key="doel_1_datum",
+        text="Wanneer wil je dit doel bereikt hebben?",
+        base_question=TextQuestion(
+            key="doel_1_datum",
+            text="Wanneer wil je dit doel bereikt hebben?",
+            placeholder="Bijvoorbeeld: over 2 jaar, in 2027...",
+            help_text="Geef een indicatie van wanneer je dit doel wilt bereiken",
         ),
-        TextQuestion(
-            key="overige_bezittingen",
-            text="Andere waardevolle bezittingen:",
-            placeholder="Bijvoorbeeld: sieraden, kunst, verzamelingen...",
-            help_text="Bezittingen met aanzienlijke waarde die je wilt meenemen",
+        condition_key="doel_1_naam",
+        condition_value="",
+    ),
+    ConditionalQuestion(
+        key="doel_1_prioriteit",
+        text="Hoe belangrijk is dit doel voor je?",
+        base_question=SelectQuestion(
+            key="doel_1_prioriteit",
+            text="Hoe belangrijk is dit doel voor je?",
+            options=_PRIORITEIT_OPTIES,
+            help_text="Geef de prioriteit van dit doel aan",
         ),
-        NumberQuestion(
-            key="overige_bezittingen_waarde",
-            text="Geschatte waarde overige bezittingen (€)",
+        condition_key="doel_1_naam",
+        condition_value="",
+    ),
+    # Second goal (optional)
+    SelectWithCustomQuestion(
+        key="doel_2_naam",
+        text="Heb je nog een tweede financieel doel? (optioneel)",
+        options=_OPTIONAL_DOEL_OPTIES,
+        custom_option_label="Anders, namelijk:",
+        suggestions=FINANCIELE_DOEL_SUGGESTIES,
+        help_text="Optioneel: kies een tweede financieel doel of vul je eigen doel in",
+    ),
+    ConditionalQuestion(
+        key="doel_2_bedrag",
+        text="Hoeveel geld heb je hiervoor nodig?",
+        base_question=NumberQuestion(
+            key="doel_2_bedrag",
+            text="Hoeveel geld heb je hiervoor nodig? (€)",
             min_value=0,
             step=500,
-            help_text="Totale geschatte waarde van je overige bezittingen",
+            help_text="Het totale bedrag voor je tweede doel",
         ),
-    ]
+        condition_key="doel_2_naam",
+        condition_value="",
+    ),
+    ConditionalQuestion(
+        key="doel_2_prioriteit",
+        text="Hoe belangrijk is dit tweede doel?",
+        base_question=SelectQuestion(
+            key="doel_2_prioriteit",
+            text="Hoe belangrijk is dit tweede doel?",
+            options=_PRIORITEIT_OPTIES,
+            help_text="Geef de prioriteit van dit tweede doel aan",
+        ),
+        condition_key="doel_2_naam",
+        condition_value="",
+    ),
+]
+
+_DOELEN_CATEGORY = QuestionCategory(
+    name="Doelen",
+    description="Je financiële doelstellingen en plannen",
+    icon="🎯",
+    questions=_DOELEN_QUESTIONS,
+)
 
-    categories.append(
-        QuestionCategory(
-            name="Bezittingen",
-            description="Overzicht van je vermogen en waardevolle spullen",
-            icon="💰",
-            questions=bezittingen_questions,
-        )
-    )
+_COMPREHENSIVE_CATEGORIES: Tuple[QuestionCategory, ...] = (
+    _PERSOONLIJK_CATEGORY,
+    _WONING_CATEGORY,
+    _FINANCIELE_PRODUCTEN_CATEGORY,
+    _GEORDENDE_ZAKEN_CATEGORY,
+    _BEZITTINGEN_CATEGORY,
+    _SCHULDEN_CATEGORY,
+    _INKOMSTEN_UITGAVEN_CATEGORY,
+    _DOELEN_CATEGORY,
+)
 
-    # Category 6: Schulden
-    schulden_questions = [
-        SelectQuestion(
-            key="schuld_type_1",
-            text="Welk type schuld heb je (eerste schuld)?",
-            options=[
-                "Geen schulden",
-                "Studieschuld",
-                "Persoonlijke lening",
-                "Creditcard schuld",
-                "Doorlopend krediet",
-                "Auto financiering",
-                "Overige lening",
-            ],
-            help_text="Selecteer je belangrijkste type schuld",
-        ),
-        ConditionalQuestion(
-            key="schuld_bedrag_1",
-            text="Wat is het totale bedrag van deze schuld?",
-            base_question=NumberQuestion(
-                key="schuld_bedrag_1",
-                text="Wat is het totale bedrag van deze schuld? (€)",
-                min_value=0,
-                step=100,
-                help_text="Het totale bedrag dat je nog moet afbetalen",
-            ),
-            condition_key="schuld_type_1",
-            condition_value=[
-                "Studieschuld",
-                "Persoonlijke lening",
-                "Creditcard schuld",
-                "Doorlopend krediet",
-                "Auto financiering",
-                "Overige lening",
-            ],
-        ),
-        ConditionalQuestion(
-            key="schuld_maandlasten_1",
-            text="Wat betaal je maandelijks af?",
-            base_question=NumberQuestion(
-                key="schuld_maandlasten_1",
-                text="Wat betaal je maandelijks af? (€)",
-                min_value=0,
-                step=25,
-                help_text="Maandelijkse aflossing van deze schuld",
-            ),
-            condition_key="schuld_type_1",
-            condition_value=[
-                "Studieschuld",
-                "Persoonlijke lening",
-                "Creditcard schuld",
-                "Doorlopend krediet",
-                "Auto financiering",
-                "Overige lening",
-            ],
-        ),
-        # Second debt (optional)
-        SelectQuestion(
-            key="schuld_type_2",
-            text="Heb je nog een tweede type schuld?",
-            options=[
-                "Geen tweede schuld",
-                "Studieschuld",
-                "Persoonlijke lening",
-                "Creditcard schuld",
-                "Doorlopend krediet",
-                "Auto financiering",
-                "Overige lening",
-            ],
-            help_text="Optioneel: selecteer een tweede type schuld",
-        ),
-        ConditionalQuestion(
-            key="schuld_bedrag_2",
-            text="Wat is het totale bedrag van deze tweede schuld?",
-            base_question=NumberQuestion(
-                key="schuld_bedrag_2",
-                text="Wat is het totale bedrag van deze tweede schuld? (€)",
-                min_value=0,
-                step=100,
-                help_text="Het totale bedrag van je tweede schuld",
-            ),
-            condition_key="schuld_type_2",
-            condition_value=[
-                "Studieschuld",
-                "Persoonlijke lening",
-                "Creditcard schuld",
-                "Doorlopend krediet",
-                "Auto financiering",
-                "Overige lening",
-            ],
-        ),
-        ConditionalQuestion(
-            key="schuld_maandlasten_2",
-            text="Wat betaal je maandelijks af aan deze tweede schuld?",
-            base_question=NumberQuestion(
-                key="schuld_maandlasten_2",
-                text="Wat betaal je maandelijks af aan deze tweede schuld? (€)",
-                min_value=0,
-                step=25,
-                help_text="Maandelijkse aflossing van je tweede schuld",
-            ),
-            condition_key="schuld_type_2",
-            condition_value=[
-                "Studieschuld",
-                "Persoonlijke lening",
-                "Creditcard schuld",
-                "Doorlopend krediet",
-                "Auto financiering",
-                "Overige lening",
-            ],
-        ),
-    ]
+_COMPREHENSIVE_CONFIG = QuestionnaireConfig(
+    session_prefix="comprehensive_financiele_apk",
+    show_progress=True,
+    show_previous_answers=False,  # Categories handle their own context
+    navigation_style="columns",
+)
 
-    categories.append(
-        QuestionCategory(
-            name="Schulden",
-            description="Overzicht van je leningen en verplichtingen",
-            icon="📉",
-            questions=schulden_questions,
-        )
-    )
 
-    # Category 7: Inkomsten & uitgaven
-    inkomsten_uitgaven_questions = [
-        NumberQuestion(
-            key="primair_inkomen",
-            text="Wat is je primaire netto maandinkomen? (€)",
-            min_value=0,
-            step=100,
-            help_text="Je belangrijkste bron van inkomen (salaris, uitkering, etc.)",
-        ),
-        NumberQuestion(
-            key="bijinkomen",
-            text="Heb je bijkomende inkomsten per maand? (€)",
-            min_value=0,
-            step=50,
-            help_text="Freelance, huur, dividenden, etc. (0 als je geen bijinkomen hebt)",
-        ),
-        NumberQuestion(
-            key="vaste_lasten",
-            text="Wat zijn je totale vaste lasten per maand? (€)",
-            min_value=0,
-            step=50,
-            help_text="Huur/hypotheek, verzekeringen, abonnementen, telefoon, etc.",
-        ),
-        NumberQuestion(
-            key="energie_kosten",
-            text="Wat betaal je maandelijks aan energie? (€)",
-            min_value=0,
-            step=25,
-            help_text="Gas, water, licht",
-        ),
-        NumberQuestion(
-            key="variabele_kosten",
-            text="Wat geef je gemiddeld uit aan variabele kosten? (€)",
-            min_value=0,
-            step=50,
-            help_text="Boodschappen, kleding, entertainment, hobby's, etc.",
-        ),
-        NumberQuestion(
-            key="spaarritme",
-            text="Hoeveel denk je realistisch per maand te kunnen sparen/beleggen? (€)",
-            min_value=0,
-            step=25,
-            help_text="Het bedrag dat je maandelijks opzij kunt zetten",
-        ),
-    ]
+@st.cache_resource(show_spinner=False)
+def create_comprehensive_financiele_apk_questionnaire() -> CategoricalQuestionnaire:
+    """Create the comprehensive categorical Financiele APK questionnaire.
 
-    categories.append(
-        QuestionCategory(
-            name="Inkomsten & uitgaven",
-            description="Je maandelijkse geldstromen",
-            icon="💳",
-            questions=inkomsten_uitgaven_questions,
-        )
-    )
+    Creates 8 categories of questions covering all aspects of personal finance:
+    - Persoonlijke situatie
+    - Woonsituatie
+    - Financiële producten
+    - Geordende zaken
+    - Bezittingen
+    - Schulden
+    - Inkomsten & uitgaven
+    - Doelen
 
-    # Category 8: Doelen
-    doelen_questions = [
-        SelectWithCustomQuestion(
-            key="doel_1_naam",
-            text="Wat is je (eerste) financiële doel?",
-            options=[
-                "Geldbuffer opbouwen van 6 maanden aan uitgaven",
-                "Overzicht krijgen in Financiën en uitgaven",
-                "(Studie) Schulden aflossen",
-                "Financieel gezond worden",
-                "Studie/opleiding",
-                "Huis kopen",
-                "Nieuwe waggie",
-                "Startkapitaal opbouwen om een eigen zaak te beginnen",
-                "Wereldreis/Sabbatical",
-                "Studie kinderen",
-                "Hypotheekschuld aflossen",
-                "Verbouwing",
-                "Pensioen opbouwen",
-                "Eerder stoppen met werken",
-                "Financiële Onafhankelijkheid",
-            ],
-            custom_option_label="Anders, namelijk:",
-            suggestions=FINANCIELE_DOEL_SUGGESTIES,
-            help_text="Kies je belangrijkste financiële doel of vul je eigen doel in",
-        ),
-        ConditionalQuestion(
-            key="doel_1_bedrag",
-            text="Hoeveel geld heb je hiervoor nodig?",
-            base_question=NumberQuestion(
-                key="doel_1_bedrag",
-                text="Hoeveel geld heb je hiervoor nodig? (€)",
-                min_value=0,
-                step=500,
-                help_text="Het totale bedrag dat je nodig hebt voor dit doel",
-            ),
-            condition_key="doel_1_naam",
-            condition_value="",  # Show if name is not empty
-        ),
-        ConditionalQuestion(
-            key="doel_1_huidig",
-            text="Hoeveel heb je hier al voor gespaard?",
-            base_question=NumberQuestion(
-                key="doel_1_huidig",
-                text="Hoeveel heb je hier al voor gespaard? (€)",
-                min_value=0,
-                step=100,
-                help_text="Het bedrag dat je al hebt gespaard voor dit doel",
-            ),
-            condition_key="doel_1_naam",
-            condition_value="",
-        ),
-        ConditionalQuestion(
-            key="doel_1_datum",
-            text="Wanneer wil je dit doel bereikt hebben?",
-            base_question=TextQuestion(
-                key="doel_1_datum",
-                text="Wanneer wil je dit doel bereikt hebben?",
-                placeholder="Bijvoorbeeld: over 2 jaar, in 2027...",
-                help_text="Geef een indicatie van wanneer je dit doel wilt bereiken",
-            ),
-            condition_key="doel_1_naam",
-            condition_value="",
-        ),
-        ConditionalQuestion(
-            key="doel_1_prioriteit",
-            text="Hoe belangrijk is dit doel voor je?",
-            base_question=SelectQuestion(
-                key="doel_1_prioriteit",
-                text="Hoe belangrijk is dit doel voor je?",
-                options=["Hoog", "Middel", "Laag"],
-                help_text="Geef de prioriteit van dit doel aan",
-            ),
-            condition_key="doel_1_naam",
-            condition_value="",
-        ),
-        # Second goal (optional)
-        SelectWithCustomQuestion(
-            key="doel_2_naam",
-            text="Heb je nog een tweede financieel doel? (optioneel)",
-            options=[
-                "",
-                "Geldbuffer opbouwen van 6 maanden aan uitgaven",
-                "Overzicht krijgen in Financiën en uitgaven",
-                "(Studie) Schulden aflossen",
-                "Financieel gezond worden",
-                "Studie/opleiding",
-                "Huis kopen",
-                "Nieuwe waggie",
-                "Startkapitaal opbouwen om een eigen zaak te beginnen",
-                "Wereldreis/Sabbatical",
-                "Studie kinderen",
-                "Hypotheekschuld aflossen",
-                "Verbouwing",
-                "Pensioen opbouwen",
-                "Eerder stoppen met werken",
-                "Financiële Onafhankelijkheid",
-            ],
-            custom_option_label="Anders, namelijk:",
-            suggestions=FINANCIELE_DOEL_SUGGESTIES,
-            help_text="Optioneel: kies een tweede financieel doel of vul je eigen doel in",
-        ),
-        ConditionalQuestion(
-            key="doel_2_bedrag",
-            text="Hoeveel geld heb je hiervoor nodig?",
-            base_question=NumberQuestion(
-                key="doel_2_bedrag",
-                text="Hoeveel geld heb je hiervoor nodig? (€)",
-                min_value=0,
-                step=500,
-                help_text="Het totale bedrag voor je tweede doel",
-            ),
-            condition_key="doel_2_naam",
-            condition_value="",
-        ),
-        ConditionalQuestion(
-            key="doel_2_prioriteit",
-            text="Hoe belangrijk is dit tweede doel?",
-            base_question=SelectQuestion(
-                key="doel_2_prioriteit",
-                text="Hoe belangrijk is dit tweede doel?",
-                options=["Hoog", "Middel", "Laag"],
-                help_text="Geef de prioriteit van dit tweede doel aan",
-            ),
-            condition_key="doel_2_naam",
-            condition_value="",
-        ),
-    ]
+    Returns
+    -------
+    CategoricalQuestionnaire
+        Complete multi-category questionnaire
 
-    categories.append(
-        QuestionCategory(
-            name="Doelen",
-            description="Je financiële doelstellingen en plannen",
-            icon="🎯",
-            questions=doelen_questions,
-        )
+    Note
+    ----
+    The instance is cached and shared across reruns and sessions; progress and
+    answers live in session state, not on the questionnaire.
+    """
+    return CategoricalQuestionnaire(
+        "comprehensive_apk", list(_COMPREHENSIVE_CATEGORIES), _COMPREHENSIVE_CONFIG
     )
 
-    config = QuestionnaireConfig(
-        session_prefix="comprehensive_financiele_apk",
-        show_progress=True,
-        show_previous_answers=False,  # Categories handle their own context
-        navigation_style="columns",
-    )
 
-    return CategoricalQuestionnaire("comprehensive_apk", categories, config)
+# Allowed gap between reported and calculated leftover (euros)
+_CONSISTENCY_TOLERANCE: float = 50.0
+# Shared result for the common consistent case
+_CONSISTENT: Tuple[bool, str] = (True, "")
+
+# Euro amount with thousands separators and cents, e.g. "€1,234.50"
+_format_eur: Callable[[float], str] = "€{:,.2f}".format
 
 
 def validate_financial_consistency(
@@ -1547,30 +1719,32 @@ def validate_financial_consistency(
     False
     """
     calculated_leftover = monthly_income - monthly_expenses
-    difference = abs(calculated_leftover - monthly_leftover)
-    tolerance = 50.0  # €50 tolerance
+    difference = calculated_leftover - monthly_leftover
 
-    if difference <= tolerance:
-        return True, ""
+    if -_CONSISTENCY_TOLERANCE <= difference <= _CONSISTENCY_TOLERANCE:
+        return _CONSISTENT
 
+    # Only format the (comparatively expensive) warning text on failure
     if monthly_leftover > calculated_leftover:
         return (
             False,
-            f"⚠️ Je zegt €{monthly_leftover:,.2f} over te houden, maar op basis "
-            f"van je inkomen (€{monthly_income:,.2f}) en uitgaven "
-            f"(€{monthly_expenses:,.2f}) zou je €{calculated_leftover:,.2f} "
-            f"over moeten houden. Controleer je bedragen.",
+            f"⚠️ Je zegt {_format_eur(monthly_leftover)} over te houden, maar op "
+            f"basis van je inkomen ({_format_eur(monthly_income)}) en uitgaven "
+            f"({_format_eur(monthly_expenses)}) zou je "
+            f"{_format_eur(calculated_leftover)} over moeten houden. "
+            f"Controleer je bedragen.",
         )
     return (
         False,
-        f"⚠️ Op basis van je inkomen (€{monthly_income:,.2f}) en uitgaven "
-        f"(€{monthly_expenses:,.2f}) zou je €{calculated_leftover:,.2f} over "
-        f"moeten houden, maar je zegt slechts €{monthly_leftover:,.2f} over "
+        f"⚠️ Op basis van je inkomen ({_format_eur(monthly_income)}) en uitgaven "
+        f"({_format_eur(monthly_expenses)}) zou je "
+        f"{_format_eur(calculated_leftover)} over moeten houden, maar je zegt "
+        f"slechts {_format_eur(monthly_leftover)} over "
         f"te houden. Mogelijk heb je uitgaven vergeten?",
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinancieleAPKData:  # pylint: disable=too-many-instance-attributes
     """Data structure for comprehensive Financiele APK information.
 
@@ -1590,14 +1764,14 @@ class FinancieleAPKData:  # pylint: disable=too-many-instance-attributes
         Total value of all assets in euros
     total_debt : float
         Total amount of all debts in euros
-    assets : List[Asset]
-        Detailed list of individual assets
-    liabilities : List[Liability]
-        Detailed list of individual debts
-    income_streams : List[MonthlyFlow]
-        Detailed list of income sources
-    expense_streams : List[MonthlyFlow]
-        Detailed list of expense categories
+    assets : Tuple[Asset, ...]
+        Individual assets
+    liabilities : Tuple[Liability, ...]
+        Individual debts
+    income_streams : Tuple[MonthlyFlow, ...]
+        Individual income sources
+    expense_streams : Tuple[MonthlyFlow, ...]
+        Individual expense categories
 
     Example
     -------
@@ -1607,10 +1781,10 @@ class FinancieleAPKData:  # pylint: disable=too-many-instance-attributes
     ...     monthly_leftover=500.0,
     ...     total_assets=10000.0,
     ...     total_debt=5000.0,
-    ...     assets=[Asset(name="Savings", value=10000.0)],
-    ...     liabilities=[Liability(name="Loan", amount=5000.0)],
-    ...     income_streams=[MonthlyFlow(name="Salary", amount=3000.0)],
-    ...     expense_streams=[MonthlyFlow(name="Living", amount=2500.0)]
+    ...     assets=(Asset(name="Savings", value=10000.0),),
+    ...     liabilities=(Liability(name="Loan", amount=5000.0),),
+    ...     income_streams=(MonthlyFlow(name="Salary", amount=3000.0),),
+    ...     expense_streams=(MonthlyFlow(name="Living", amount=2500.0),)
     ... )
     >>> data.monthly_income
     3000.0
@@ -1618,7 +1792,9 @@ class FinancieleAPKData:  # pylint: disable=too-many-instance-attributes
     Note
     ----
     In simple mode, assets, liabilities, income_streams, and expense_streams
-    will contain single items representing the totals.
+    will contain single items representing the totals. Instances are frozen
+    and built from tuples only, so they are hashable by value; build a new
+    instance instead of reassigning fields.
     """
 
     monthly_income: float
@@ -1626,10 +1802,35 @@ class FinancieleAPKData:  # pylint: disable=too-many-instance-attributes
     monthly_leftover: float
     total_assets: float
     total_debt: float
-    assets: List[Asset]
-    liabilities: List[Liability]
-    income_streams: List[MonthlyFlow]
-    expense_streams: List[MonthlyFlow]
+    assets: Tuple[Asset, ...]
+    liabilities: Tuple[Liability, ...]
+    income_streams: Tuple[MonthlyFlow, ...]
+    expense_streams: Tuple[MonthlyFlow, ...]
+
+
+# Static onboarding texts
+_ONBOARDING_MD = """
+- 🔍 **De tool helpt je inzicht te krijgen in jouw financiële situatie**
+  We analyseren je huidige inkomsten, uitgaven, bezittingen en schulden
+
+- ⚠️ **Je ontdekt aandachtspunten, valkuilen en kansen**
+  Identificeer risico's en mogelijkheden voor verbetering
+
+- 📋 **Op basis hiervan worden actiepunten en een concreet plan gemaakt**
+  Krijg praktische stappen om je financiële situatie te verbeteren
+
+- 🎯 **Je doelen worden doorgerekend (sparen of beleggen)**
+  We berekenen realistische scenario's voor je financiële doelen
+
+- 🚀 **Tot slot ga je aan de slag met uitvoeren en monitoren**
+  Implementeer het plan en houd je voortgang bij
+"""
+_ONBOARDING_INFO = (
+    "Net zoals een auto een APK nodig heeft voor veiligheid, heeft je "
+    "financiële situatie regelmatig een check-up nodig. Deze tool helpt "
+    "je om grip te krijgen op je geld en slimme keuzes te maken voor je "
+    "toekomst."
+)
 
 
 def show_onboarding() -> bool:
@@ -1664,36 +1865,14 @@ def show_onboarding() -> bool:
     st.write("### Wat houdt de Financiële APK in?")
 
     # Bullet points explaining the tool
-    st.markdown(
-        """
-    - 🔍 **De tool helpt je inzicht te krijgen in jouw financiële situatie**
-      We analyseren je huidige inkomsten, uitgaven, bezittingen en schulden
-
-    - ⚠️ **Je ontdekt aandachtspunten, valkuilen en kansen**
-      Identificeer risico's en mogelijkheden voor verbetering
-
-    - 📋 **Op basis hiervan worden actiepunten en een concreet plan gemaakt**
-      Krijg praktische stappen om je financiële situatie te verbeteren
-
-    - 🎯 **Je doelen worden doorgerekend (sparen of beleggen)**
-      We berekenen realistische scenario's voor je financiële doelen
-
-    - 🚀 **Tot slot ga je aan de slag met uitvoeren en monitoren**
-      Implementeer het plan en houd je voortgang bij
-    """
-    )
+    st.markdown(_ONBOARDING_MD)
 
     st.write("---")
 
     # Information card with additional context
     display_info_card(
         title="Waarom een Financiële APK?",
-        content=(
-            "Net zoals een auto een APK nodig heeft voor veiligheid, heeft je "
-            "financiële situatie regelmatig een check-up nodig. Deze tool helpt "
-            "je om grip te krijgen op je geld en slimme keuzes te maken voor je "
-            "toekomst."
-        ),
+        content=_ONBOARDING_INFO,
         icon="💡",
         card_type="info",
     )
@@ -1713,6 +1892,73 @@ def show_onboarding() -> bool:
     return start_clicked
 
 
+# Questions of the quick APK, built once at import
+_QUICK_QUESTIONS: Tuple[Question, ...] = (
+    NumberQuestion(
+        key="monthly_income",
+        text="Wat is je maandelijks netto totaal inkomen gemiddeld genomen?",
+        min_value=0.0,
+        step=100.0,
+        format_str="%.2f",
+        help_text="Voer je totale maandelijkse netto inkomen in euro's in",
+    ),
+    NumberQuestion(
+        key="monthly_expenses",
+        text="Wat zijn je totale maandelijkse uitgaven?",
+        min_value=0.0,
+        step=100.0,
+        format_str="%.2f",
+        help_text=(
+            "Voer je totale maandelijkse uitgaven in euro's in "
+            "(huur, boodschappen, verzekeringen, etc.)"
+        ),
+    ),
+    NumberQuestion(
+        key="monthly_leftover",
+        text=(
+            "Hoeveel geld houd je gemiddeld maandelijks over "
+            "om te kunnen sparen of beleggen?"
+        ),
+        min_value=0.0,
+        step=50.0,
+        format_str="%.2f",
+        help_text=(
+            "(Tip: je kunt dit nagaan door je bankafschriften te checken. "
+            "Reken alleen echt het geld dat je overhoudt. Dus niet geld "
+            "dat je apart zet voor een vakantie, een nieuwe auto of "
+            "andere spaardoelen.)"
+        ),
+    ),
+    NumberQuestion(
+        key="total_assets",
+        text="Hoeveel spaargeld, beleggingen of andere bezittingen bezit je nu?",
+        min_value=0.0,
+        step=1000.0,
+        format_str="%.2f",
+        help_text=(
+            "Voer de totale waarde van je bezittingen in euro's in "
+            "(spaargeld, investeringen, huis, auto, etc.)"
+        ),
+    ),
+    NumberQuestion(
+        key="total_debt",
+        text="Wat is je totaal aantal schulden?",
+        min_value=0.0,
+        step=1000.0,
+        format_str="%.2f",
+        help_text='Als je geen schulden hebt, vul hier "0" in.',
+    ),
+)
+
+_QUICK_CONFIG = QuestionnaireConfig(
+    session_prefix="financiele_apk",
+    show_progress=False,
+    show_previous_answers=True,
+    navigation_style="columns",
+)
+
+
+@st.cache_resource(show_spinner=False)
 def create_financiele_apk_questionnaire() -> Questionnaire:
     """Create a questionnaire for collecting Financiele APK data.
 
@@ -1735,73 +1981,17 @@ def create_financiele_apk_questionnaire() -> Questionnaire:
     Note
     ----
     The questionnaire collects data for simple Financiele APK calculation.
-    All monetary values are in Euros (€).
+    All monetary values are in Euros (€). The instance is cached and shared
+    across reruns and sessions; answers live in session state, not on it.
     """
-    questions = [
-        NumberQuestion(
-            key="monthly_income",
-            text="Wat is je maandelijks netto totaal inkomen gemiddeld genomen?",
-            min_value=0.0,
-            step=100.0,
-            format_str="%.2f",
-            help_text="Voer je totale maandelijkse netto inkomen in euro's in",
-        ),
-        NumberQuestion(
-            key="monthly_expenses",
-            text="Wat zijn je totale maandelijkse uitgaven?",
-            min_value=0.0,
-            step=100.0,
-            format_str="%.2f",
-            help_text=(
-                "Voer je totale maandelijkse uitgaven in euro's in "
-                "(huur, boodschappen, verzekeringen, etc.)"
-            ),
-        ),
-        NumberQuestion(
-            key="monthly_leftover",
-            text=(
-                "Hoeveel geld houd je gemiddeld maandelijks over "
-                "om te kunnen sparen of beleggen?"
-            ),
-            min_value=0.0,
-            step=50.0,
-            format_str="%.2f",
-            help_text=(
-                "(Tip: je kunt dit nagaan door je bankafschriften te checken. "
-                "Reken alleen echt het geld dat je overhoudt. Dus niet geld "
-                "dat je apart zet voor een vakantie, een nieuwe auto of "
-                "andere spaardoelen.)"
-            ),
-        ),
-        NumberQuestion(
-            key="total_assets",
-            text="Hoeveel spaargeld, beleggingen of andere bezittingen bezit je nu?",
-            min_value=0.0,
-            step=1000.0,
-            format_str="%.2f",
-            help_text=(
-                "Voer de totale waarde van je bezittingen in euro's in "
-                "(spaargeld, investeringen, huis, auto, etc.)"
-            ),
-        ),
-        NumberQuestion(
-            key="total_debt",
-            text="Wat is je totaal aantal schulden?",
-            min_value=0.0,
-            step=1000.0,
-            format_str="%.2f",
-            help_text='Als je geen schulden hebt, vul hier "0" in.',
-        ),
-    ]
+    return Questionnaire("financiele_apk_data", list(_QUICK_QUESTIONS), _QUICK_CONFIG)
 
-    config = QuestionnaireConfig(
-        session_prefix="financiele_apk",
-        show_progress=False,
-        show_previous_answers=True,
-        navigation_style="columns",
-    )
 
-    return Questionnaire("financiele_apk_data", questions, config)
+def _single_entry(
+    record_type: Callable[[str, float], Any], name: str, amount: float
+) -> Tuple[Any, ...]:
+    """Return a one-record tuple for a positive amount, else an empty tuple."""
+    return (record_type(name, amount),) if amount > 0 else ()
 
 
 def _create_simple_financial_lists(
@@ -1809,8 +1999,13 @@ def _create_simple_financial_lists(
     monthly_expenses: float,
     total_assets: float,
     total_debt: float,
-) -> Tuple[List[Asset], List[Liability], List[MonthlyFlow], List[MonthlyFlow]]:
-    """Create simple financial data lists for consistency with advanced mode.
+) -> Tuple[
+    Tuple[Asset, ...],
+    Tuple[Liability, ...],
+    Tuple[MonthlyFlow, ...],
+    Tuple[MonthlyFlow, ...],
+]:
+    """Create simple financial data entries for consistency with advanced mode.
 
     Parameters
     ----------
@@ -1825,31 +2020,19 @@ def _create_simple_financial_lists(
 
     Returns
     -------
-    Tuple[List[Asset], List[Liability], List[MonthlyFlow], List[MonthlyFlow]]
-        Tuple containing assets, liabilities, income_streams, expense_streams lists
+    Tuple[Tuple[Asset, ...], ...]
+        Assets, liabilities, income streams and expense streams, each holding
+        at most one entry
     """
-    assets = (
-        [Asset(name="Totale bezittingen", value=total_assets)]
-        if total_assets > 0
-        else []
-    )
-    liabilities = (
-        [Liability(name="Totale schulden", amount=total_debt)] if total_debt > 0 else []
-    )
-    income_streams = (
-        [MonthlyFlow(name="Maandelijks inkomen", amount=monthly_income)]
-        if monthly_income > 0
-        else []
-    )
-    expense_streams = (
-        [MonthlyFlow(name="Maandelijkse uitgaven", amount=monthly_expenses)]
-        if monthly_expenses > 0
-        else []
+    return (
+        _single_entry(Asset, "Totale bezittingen", total_assets),
+        _single_entry(Liability, "Totale schulden", total_debt),
+        _single_entry(MonthlyFlow, "Maandelijks inkomen", monthly_income),
+        _single_entry(MonthlyFlow, "Maandelijkse uitgaven", monthly_expenses),
     )
 
-    return assets, liabilities, income_streams, expense_streams
-
 
+@st.cache_data(show_spinner=False, max_entries=64)
 def questionnaire_data_to_financiele_apk(
     data: Dict[str, float],
 ) -> FinancieleAPKData:
@@ -1869,7 +2052,7 @@ def questionnaire_data_to_financiele_apk(
     -------
     FinancieleAPKData
         Complete financial data structure with user-provided monthly leftover
-        and single-item lists for consistency
+        and single-item tuples for consistency
 
     Example
     -------
@@ -1886,9 +2069,10 @@ def questionnaire_data_to_financiele_apk(
 
     Note
     ----
-    Creates single-item lists for assets, liabilities, income_streams,
+    Creates single-item tuples for assets, liabilities, income_streams,
     and expense_streams to maintain consistency with advanced mode structure.
-    Uses user-provided monthly_leftover instead of calculating it.
+    Uses user-provided monthly_leftover instead of calculating it. Results are
+    cached on the content of ``data``, so reruns reuse the converted structure.
     """
     monthly_income = data.get("monthly_income", 0.0)
     monthly_expenses = data.get("monthly_expenses", 0.0)
@@ -1916,6 +2100,63 @@ def questionnaire_data_to_financiele_apk(
     )
 
 
+# Amount answers of the comprehensive APK with their display labels. Debt and
+# car labels are replaced by the user's own answers where available.
+_INCOME_ITEMS: Tuple[Tuple[str, str], ...] = (
+    ("primair_inkomen", "Primair inkomen"),
+    ("bijinkomen", "Bijinkomen"),
+)
+_EXPENSE_ITEMS: Tuple[Tuple[str, str], ...] = (
+    ("vaste_lasten", "Vaste lasten"),
+    ("energie_kosten", "Energie"),
+    ("variabele_kosten", "Variabele kosten"),
+    ("hypotheek_maandlasten", "Hypotheek"),
+    ("maandelijkse_huur", "Huur"),
+    ("schuld_maandlasten_1", "Schuld aflossing"),
+    ("schuld_maandlasten_2", "Tweede schuld aflossing"),
+)
+_ASSET_ITEMS: Tuple[Tuple[str, str], ...] = (
+    ("spaarsaldo", "Spaarsaldo"),
+    ("auto_waarde", "Auto"),
+    ("beleggingen_waarde", "Beleggingen"),
+    ("overige_bezittingen_waarde", "Overige bezittingen"),
+    ("woningwaarde", "Woning"),
+)
+_DEBT_ITEMS: Tuple[Tuple[str, str], ...] = (
+    ("hypotheekbedrag", "Hypotheek"),
+    ("schuld_bedrag_1", "Schuld"),
+    ("schuld_bedrag_2", "Tweede schuld"),
+)
+
+
+@lru_cache(maxsize=128)
+def _aflossing_name(debt_type: str) -> str:
+    """Name the repayment stream of a debt type, built and interned once per type."""
+    return sys.intern(f"{debt_type} aflossing")
+
+
+def _filled_records(
+    get: Callable[[str, float], float],
+    items: Tuple[Tuple[str, str], ...],
+    record_type: Callable[[str, float], Any],
+    names: Dict[str, str],
+) -> Tuple[float, Tuple[Any, ...]]:
+    """Sum the amounts of ``items`` and build a record for each positive one.
+
+    Each answer is read once for both the total and the record. The record is
+    named from ``names`` when the item has a dynamic name and from its table
+    label otherwise.
+    """
+    amounts = [get(key, 0.0) for key, _ in items]
+    records = tuple(
+        record_type(names.get(key, label), amount)
+        for (key, label), amount in zip(items, amounts)
+        if amount > 0
+    )
+    return sum(amounts), records
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
 def comprehensive_data_to_financiele_apk(data: Dict[str, Any]) -> FinancieleAPKData:
     """Convert comprehensive questionnaire data to FinancieleAPKData structure.
 
@@ -1931,118 +2172,46 @@ def comprehensive_data_to_financiele_apk(data: Dict[str, Any]) -> FinancieleAPKD
     -------
     FinancieleAPKData
         Complete financial data structure with calculated totals
-    """
-    # Calculate monthly income
-    monthly_income = data.get("primair_inkomen", 0.0) + data.get("bijinkomen", 0.0)
-
-    # Calculate monthly expenses
-    monthly_expenses = (
-        data.get("vaste_lasten", 0.0)
-        + data.get("energie_kosten", 0.0)
-        + data.get("variabele_kosten", 0.0)
-        + data.get("hypotheek_maandlasten", 0.0)
-        + data.get("maandelijkse_huur", 0.0)
-        + data.get("schuld_maandlasten_1", 0.0)
-        + data.get("schuld_maandlasten_2", 0.0)
-    )
 
-    # Calculate monthly leftover
-    monthly_leftover = monthly_income - monthly_expenses
+    Note
+    ----
+    Results are cached on the content of ``data``, so reruns with the same
+    answers reuse the converted structure.
+    """
+    get = data.get
+
+    # Names that depend on other answers, keyed by the amount they label
+    auto_name = get("auto_merk", "Auto")
+    if not auto_name.strip():
+        auto_name = "Auto"
+    debt_type_1 = get("schuld_type_1")
+    debt_type_2 = get("schuld_type_2")
+    names = {
+        "auto_waarde": auto_name,
+        "schuld_bedrag_1": (
+            "Schuld" if debt_type_1 in (None, "Geen schulden") else debt_type_1
+        ),
+        "schuld_bedrag_2": (
+            "Tweede schuld"
+            if debt_type_2 in (None, "Geen tweede schuld")
+            else debt_type_2
+        ),
+        "schuld_maandlasten_1": _aflossing_name(debt_type_1 or "Schuld aflossing"),
+        "schuld_maandlasten_2": _aflossing_name(
+            debt_type_2 or "Tweede schuld aflossing"
+        ),
+    }
 
-    # Calculate total assets
-    total_assets = (
-        data.get("spaarsaldo", 0.0)
-        + data.get("auto_waarde", 0.0)
-        + data.get("beleggingen_waarde", 0.0)
-        + data.get("overige_bezittingen_waarde", 0.0)
-        + data.get("woningwaarde", 0.0)
+    # Calculate totals and the detailed records of the amounts filled in
+    total_assets, assets = _filled_records(get, _ASSET_ITEMS, Asset, names)
+    total_debt, liabilities = _filled_records(get, _DEBT_ITEMS, Liability, names)
+    monthly_income, income_streams = _filled_records(
+        get, _INCOME_ITEMS, MonthlyFlow, names
     )
-
-    # Calculate total debt
-    total_debt = (
-        data.get("hypotheekbedrag", 0.0)
-        + data.get("schuld_bedrag_1", 0.0)
-        + data.get("schuld_bedrag_2", 0.0)
+    monthly_expenses, expense_streams = _filled_records(
+        get, _EXPENSE_ITEMS, MonthlyFlow, names
     )
-
-    # Create detailed lists for assets
-    assets = []
-    if data.get("spaarsaldo", 0.0) > 0:
-        assets.append(Asset(name="Spaarsaldo", value=data["spaarsaldo"]))
-    if data.get("auto_waarde", 0.0) > 0:
-        auto_name = data.get("auto_merk", "Auto")
-        if not auto_name.strip():
-            auto_name = "Auto"
-        assets.append(Asset(name=auto_name, value=data["auto_waarde"]))
-    if data.get("beleggingen_waarde", 0.0) > 0:
-        assets.append(Asset(name="Beleggingen", value=data["beleggingen_waarde"]))
-    if data.get("overige_bezittingen_waarde", 0.0) > 0:
-        assets.append(
-            Asset(name="Overige bezittingen", value=data["overige_bezittingen_waarde"])
-        )
-    if data.get("woningwaarde", 0.0) > 0:
-        assets.append(Asset(name="Woning", value=data["woningwaarde"]))
-
-    # Create detailed lists for liabilities
-    liabilities = []
-    if data.get("hypotheekbedrag", 0.0) > 0:
-        liabilities.append(Liability(name="Hypotheek", amount=data["hypotheekbedrag"]))
-    if data.get("schuld_bedrag_1", 0.0) > 0:
-        debt_name = data.get("schuld_type_1", "Schuld")
-        if debt_name == "Geen schulden":
-            debt_name = "Schuld"
-        liabilities.append(Liability(name=debt_name, amount=data["schuld_bedrag_1"]))
-    if data.get("schuld_bedrag_2", 0.0) > 0:
-        debt_name = data.get("schuld_type_2", "Tweede schuld")
-        if debt_name == "Geen tweede schuld":
-            debt_name = "Tweede schuld"
-        liabilities.append(Liability(name=debt_name, amount=data["schuld_bedrag_2"]))
-
-    # Create detailed lists for income streams
-    income_streams = []
-    if data.get("primair_inkomen", 0.0) > 0:
-        income_streams.append(
-            MonthlyFlow(name="Primair inkomen", amount=data["primair_inkomen"])
-        )
-    if data.get("bijinkomen", 0.0) > 0:
-        income_streams.append(MonthlyFlow(name="Bijinkomen", amount=data["bijinkomen"]))
-
-    # Create detailed lists for expense streams
-    expense_streams = []
-    if data.get("vaste_lasten", 0.0) > 0:
-        expense_streams.append(
-            MonthlyFlow(name="Vaste lasten", amount=data["vaste_lasten"])
-        )
-    if data.get("energie_kosten", 0.0) > 0:
-        expense_streams.append(
-            MonthlyFlow(name="Energie", amount=data["energie_kosten"])
-        )
-    if data.get("variabele_kosten", 0.0) > 0:
-        expense_streams.append(
-            MonthlyFlow(name="Variabele kosten", amount=data["variabele_kosten"])
-        )
-    if data.get("hypotheek_maandlasten", 0.0) > 0:
-        expense_streams.append(
-            MonthlyFlow(name="Hypotheek", amount=data["hypotheek_maandlasten"])
-        )
-    if data.get("maandelijkse_huur", 0.0) > 0:
-        expense_streams.append(
-            MonthlyFlow(name="Huur", amount=data["maandelijkse_huur"])
-        )
-    if data.get("schuld_maandlasten_1", 0.0) > 0:
-        debt_name = data.get("schuld_type_1", "Schuld aflossing")
-        expense_streams.append(
-            MonthlyFlow(
-                name=f"{debt_name} aflossing", amount=data["schuld_maandlasten_1"]
-            )
-        )
-    if data.get("schuld_maandlasten_2", 0.0) > 0:
-        debt_name = data.get("schuld_type_2", "Tweede schuld aflossing")
-        expense_streams.append(
-            MonthlyFlow(
-                name=f"{debt_name} aflossing", amount=data["schuld_maandlasten_2"]
-            )
-        )
+    monthly_leftover = monthly_income - monthly_expenses
 
     return FinancieleAPKData(
         monthly_income=monthly_income,
@@ -2057,6 +2226,94 @@ def comprehensive_data_to_financiele_apk(data: Dict[str, Any]) -> FinancieleAPKD
     )
 
 
+def _is_empty(value: Any) -> bool:
+    """Return True for an empty or falsy answer."""
+    return not value
+
+
+def _is_unanswered(value: Any) -> bool:
+    """Return True for a yes/no answer that was never given."""
+    return value is None
+
+
+class _CompletenessRule(NamedTuple):
+    """Warning raised when every answer in ``keys`` is missing.
+
+    ``applies`` optionally restricts the rule to answers where it returns True.
+    """
+
+    keys: Tuple[str, ...]
+    message: str
+    is_missing: Callable[[Any], bool] = _is_empty
+    applies: Optional[Callable[[Dict[str, Any]], bool]] = None
+
+
+# Completeness checks of the comprehensive APK, in display order
+_COMPLETENESS_RULES: Tuple[_CompletenessRule, ...] = (
+    # Personal information
+    _CompletenessRule(("leeftijd",), "Persoonlijke situatie: Leeftijd ontbreekt"),
+    _CompletenessRule(("relatievorm",), "Persoonlijke situatie: Relatievorm ontbreekt"),
+    # Housing situation
+    _CompletenessRule(
+        ("woon_situatie",), "Woonsituatie: Type woning (huur/koop) ontbreekt"
+    ),
+    _CompletenessRule(
+        ("maandelijkse_huur",),
+        "Woonsituatie: Huurkosten ontbreken",
+        applies=lambda data: data.get("woon_situatie") == _HUUR,
+    ),
+    _CompletenessRule(
+        ("woningwaarde",),
+        "Woonsituatie: Woningwaarde ontbreekt",
+        applies=lambda data: data.get("woon_situatie") == _KOOP,
+    ),
+    _CompletenessRule(
+        ("hypotheekbedrag", "hypotheek_maandlasten"),
+        "Woonsituatie: Hypotheekgegevens ontbreken",
+        applies=lambda data: data.get("woon_situatie") == _KOOP,
+    ),
+    # Financial products and organized affairs
+    _CompletenessRule(
+        ("financiele_producten",), "Financiële producten: Geen producten geselecteerd"
+    ),
+    _CompletenessRule(
+        ("heeft_testament",),
+        "Geordende zaken: Testament-status ontbreekt",
+        is_missing=_is_unanswered,
+    ),
+    _CompletenessRule(
+        ("pensioenopbouw_actief",),
+        "Geordende zaken: Pensioenopbouw-status ontbreekt",
+        is_missing=_is_unanswered,
+    ),
+    # Assets (the home value is covered by the housing checks)
+    _CompletenessRule(
+        (
+            "spaarsaldo",
+            "auto_waarde",
+            "beleggingen_waarde",
+            "overige_bezittingen_waarde",
+        ),
+        "Bezittingen: Geen bezittingen ingevuld",
+    ),
+    # Income and expenses
+    _CompletenessRule(
+        ("primair_inkomen",), "Inkomsten & uitgaven: Primair inkomen ontbreekt"
+    ),
+    _CompletenessRule(
+        ("vaste_lasten", "variabele_kosten"), "Woonsituatie: Uitgavengegevens ontbreken"
+    ),
+    # Goals
+    _CompletenessRule(("doel_1_naam",), "Doelen: Geen financiële doelen ingevuld"),
+    _CompletenessRule(
+        ("doel_1_bedrag",),
+        "Doelen: Doelbedrag voor eerste doel ontbreekt",
+        applies=lambda data: bool(data.get("doel_1_naam")),
+    ),
+)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
 def validate_comprehensive_data_completeness(data: Dict[str, Any]) -> List[str]:
     """Validate completeness of comprehensive questionnaire data.
 
@@ -2072,60 +2329,18 @@ def validate_comprehensive_data_completeness(data: Dict[str, Any]) -> List[str]:
     -------
     List[str]
         List of warning messages for missing data
-    """
-    warnings = []
-
-    # Check personal information
-    if not data.get("leeftijd"):
-        warnings.append("Persoonlijke situatie: Leeftijd ontbreekt")
-    if not data.get("relatievorm"):
-        warnings.append("Persoonlijke situatie: Relatievorm ontbreekt")
-
-    # Check housing situation
-    if not data.get("woon_situatie"):
-        warnings.append("Woonsituatie: Type woning (huur/koop) ontbreekt")
-    elif data.get("woon_situatie") == "Huur" and not data.get("maandelijkse_huur"):
-        warnings.append("Woonsituatie: Huurkosten ontbreken")
-    elif data.get("woon_situatie") == "Koop":
-        if not data.get("woningwaarde"):
-            warnings.append("Woonsituatie: Woningwaarde ontbreekt")
-        if not data.get("hypotheekbedrag") and not data.get("hypotheek_maandlasten"):
-            warnings.append("Woonsituatie: Hypotheekgegevens ontbreken")
-
-    # Check financial products
-    financial_products = data.get("financiele_producten", [])
-    if not financial_products:
-        warnings.append("Financiële producten: Geen producten geselecteerd")
-
-    # Check organized affairs
-    if data.get("heeft_testament") is None:
-        warnings.append("Geordende zaken: Testament-status ontbreekt")
-    if data.get("pensioenopbouw_actief") is None:
-        warnings.append("Geordende zaken: Pensioenopbouw-status ontbreekt")
-
-    # Check assets
-    total_assets = (
-        data.get("spaarsaldo", 0)
-        + data.get("auto_waarde", 0)
-        + data.get("beleggingen_waarde", 0)
-        + data.get("overige_bezittingen_waarde", 0)
-    )
-    if total_assets == 0:
-        warnings.append("Bezittingen: Geen bezittingen ingevuld")
 
-    # Check income
-    if not data.get("primair_inkomen"):
-        warnings.append("Inkomsten & uitgaven: Primair inkomen ontbreekt")
-    if not data.get("vaste_lasten") and not data.get("variabele_kosten"):
-        warnings.append("Woonsituatie: Uitgavengegevens ontbreken")
-
-    # Check goals
-    if not data.get("doel_1_naam"):
-        warnings.append("Doelen: Geen financiële doelen ingevuld")
-    elif data.get("doel_1_naam") and not data.get("doel_1_bedrag"):
-        warnings.append("Doelen: Doelbedrag voor eerste doel ontbreekt")
-
-    return warnings
+    Note
+    ----
+    Results are cached on the content of ``data``, so the results page does
+    not re-run the rules on every rerun with the same answers.
+    """
+    return [
+        rule.message
+        for rule in _COMPLETENESS_RULES
+        if (rule.applies is None or rule.applies(data))
+        and all(rule.is_missing(data.get(key)) for key in rule.keys)
+    ]
 
 
 def display_data_completeness_warnings(data: Dict[str, Any], mode: str) -> None:
@@ -2142,11 +2357,13 @@ def display_data_completeness_warnings(data: Dict[str, Any], mode: str) -> None:
         warnings = validate_comprehensive_data_completeness(data)
 
         if warnings:
-            st.warning("⚠️ **Ontbrekende gegevens gedetecteerd**")
-            st.write("Voor een completere analyse missen we nog gegevens over:")
-            for warning in warnings:
-                st.write(f"• {warning}")
-            st.write("---")
+            # One warning box holding the whole list instead of a write per item
+            missing = "\n".join(f"- {warning}" for warning in warnings)
+            st.warning(
+                "⚠️ **Ontbrekende gegevens gedetecteerd**\n\n"
+                "Voor een completere analyse missen we nog gegevens over:\n\n"
+                f"{missing}"
+            )
             st.info(
                 "💡 Je kunt de APK later opnieuw doen om deze gegevens aan te vullen."
             )
@@ -2154,85 +2371,245 @@ def display_data_completeness_warnings(data: Dict[str, Any], mode: str) -> None:
     # For quick mode, we already have the existing validation
 
 
-def create_cash_flow_visualization(data: FinancieleAPKData) -> go.Figure:
+# Session key holding the last built summary content with its amounts
+_SUMMARY_CONTENT_KEY = "apk_summary_content"
+
+# Fixed bar labels and colors of the summary charts; the last bar is blue when
+# the balance is positive and orange when it is negative
+_CASH_FLOW_CATEGORIES: Tuple[str, ...] = ("Inkomsten", "Uitgaven", "Over/Tekort")
+_NET_WORTH_CATEGORIES: Tuple[str, ...] = ("Bezittingen", "Schulden", "Eigen Vermogen")
+_POSITIVE_BAR_COLORS: Tuple[str, ...] = ("green", "red", "blue")
+_NEGATIVE_BAR_COLORS: Tuple[str, ...] = ("green", "red", "orange")
+_format_bar_text: Callable[[float], str] = "€{:,.0f}".format
+# Plotly config for the display-only summary charts
+_STATIC_CHART_CONFIG: Dict[str, bool] = {"staticPlot": True, "displayModeBar": False}
+
+# Tab labels of the summary charts, in the order of the charts
+_SUMMARY_CHART_TABS: Tuple[str, ...] = (
+    "📊 Maandelijks overzicht",
+    "💰 Vermogen overzicht",
+)
+
+
+def _bar_chart_layout(title: str) -> Dict[str, Any]:
+    """Return the layout spec shared by the APK bar charts."""
+    return {
+        "title": {"text": title},
+        "xaxis": {"title": {"text": "Categorieën"}},
+        "yaxis": {"title": {"text": "Bedrag (€)"}},
+        "showlegend": False,
+        "height": 400,
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_cash_flow_visualization(
+    monthly_income: float, monthly_expenses: float, monthly_leftover: float
+) -> go.Figure:
     """Create a bar chart visualization for monthly cash flow.
 
     Parameters
     ----------
-    data : FinancieleAPKData
-        Complete financial data structure
+    monthly_income : float
+        Total monthly income
+    monthly_expenses : float
+        Total monthly expenses
+    monthly_leftover : float
+        Amount left over (or short) each month
 
     Returns
     -------
     go.Figure
         Plotly figure showing income, expenses, and leftover amount
-    """
-    categories = ["Inkomsten", "Uitgaven", "Over/Tekort"]
-    amounts = [data.monthly_income, data.monthly_expenses, data.monthly_leftover]
-    colors = ["green", "red", "blue" if data.monthly_leftover >= 0 else "orange"]
-
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            x=categories,
-            y=amounts,
-            marker_color=colors,
-            text=[f"€{amt:,.0f}" for amt in amounts],
-            textposition="auto",
-        )
-    )
 
-    fig.update_layout(
-        title="Maandelijkse Kasstromen",
-        xaxis_title="Categorieën",
-        yaxis_title="Bedrag (€)",
-        showlegend=False,
-        height=400,
+    Note
+    ----
+    Cached on the input amounts, so reruns with unchanged data reuse the figure.
+    """
+    amounts = (monthly_income, monthly_expenses, monthly_leftover)
+    colors = _POSITIVE_BAR_COLORS if monthly_leftover >= 0 else _NEGATIVE_BAR_COLORS
+
+    # Build the whole figure from a plain spec so plotly validates it once,
+    # instead of per go.Bar/go.Layout object or add_trace/update_layout call
+    return go.Figure(
+        {
+            "data": [
+                {
+                    "type": "bar",
+                    "x": _CASH_FLOW_CATEGORIES,
+                    "y": amounts,
+                    "marker": {"color": colors},
+                    "text": tuple(map(_format_bar_text, amounts)),
+                    "textposition": "auto",
+                }
+            ],
+            "layout": _bar_chart_layout("Maandelijkse Kasstromen"),
+        }
     )
 
-    return fig
-
 
-def create_net_worth_visualization(data: FinancieleAPKData) -> go.Figure:
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_net_worth_visualization(total_assets: float, total_debt: float) -> go.Figure:
     """Create a bar chart visualization for net worth calculation.
 
     Parameters
     ----------
-    data : FinancieleAPKData
-        Complete financial data structure
+    total_assets : float
+        Total value of all assets
+    total_debt : float
+        Total outstanding debt
 
     Returns
     -------
     go.Figure
         Plotly figure showing assets, liabilities, and net worth
+
+    Note
+    ----
+    Cached on the input amounts, so reruns with unchanged data reuse the figure.
     """
-    net_worth = data.total_assets - data.total_debt
+    net_worth = total_assets - total_debt
 
-    categories = ["Bezittingen", "Schulden", "Eigen Vermogen"]
     # Make debt negative for visualization
-    amounts = [data.total_assets, -data.total_debt, net_worth]
-    colors = ["green", "red", "blue" if net_worth >= 0 else "orange"]
-
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            x=categories,
-            y=amounts,
-            marker_color=colors,
-            text=[f"€{abs(amt):,.0f}" for amt in amounts],
-            textposition="auto",
+    amounts = (total_assets, -total_debt, net_worth)
+    colors = _POSITIVE_BAR_COLORS if net_worth >= 0 else _NEGATIVE_BAR_COLORS
+
+    return go.Figure(
+        {
+            "data": [
+                {
+                    "type": "bar",
+                    "x": _NET_WORTH_CATEGORIES,
+                    "y": amounts,
+                    "marker": {"color": colors},
+                    "text": tuple(map(_format_bar_text, map(abs, amounts))),
+                    "textposition": "auto",
+                }
+            ],
+            "layout": _bar_chart_layout("Eigen Vermogen Overzicht"),
+        }
+    )
+
+
+# (label, value, delta, delta_color) for st.metric
+_MetricRow = Tuple[str, str, Optional[str], Literal["normal", "inverse", "off"]]
+
+
+class _SummaryContent(NamedTuple):
+    """Pre-built pieces of the APK summary for one set of amounts."""
+
+    fingerprint: Tuple[float, ...]
+    metric_rows: Tuple[Tuple[_MetricRow, ...], ...]
+    cash_flow_fig: go.Figure
+    net_worth_fig: go.Figure
+    # (st.success / st.error / st.warning, message) below each chart
+    cash_flow_note: Tuple[Callable[[str], Any], str]
+    net_worth_note: Tuple[Callable[[str], Any], str]
+
+
+def _build_summary_content(
+    data: FinancieleAPKData, fingerprint: Tuple[float, ...]
+) -> _SummaryContent:
+    """Format the metrics, figures and messages shown by display_summary."""
+    # Calculate totals from the data
+    net_worth = data.total_assets - data.total_debt
+    # Use the user-provided monthly_leftover instead of calculating it
+    monthly_leftover = data.monthly_leftover
+
+    has_surplus = monthly_leftover >= 0
+    balance_metrics: Tuple[_MetricRow, ...] = (
+        ("Totale Bezittingen", _format_eur(data.total_assets), None, "normal"),
+        ("Totale Schulden", _format_eur(data.total_debt), None, "normal"),
+        ("Eigen Vermogen", _format_eur(net_worth), None, "normal"),
+    )
+    cash_flow_metrics: Tuple[_MetricRow, ...] = (
+        ("Maandelijkse Inkomsten", _format_eur(data.monthly_income), None, "normal"),
+        ("Maandelijkse Uitgaven", _format_eur(data.monthly_expenses), None, "normal"),
+        (
+            "Maandelijks Over" if has_surplus else "Maandelijks Tekort",
+            _format_eur(abs(monthly_leftover)),
+            f"{'Positief' if has_surplus else 'Negatief'} saldo",
+            "normal" if has_surplus else "inverse",
+        ),
+    )
+
+    # Text summary for cash flow
+    cash_flow_note: Tuple[Callable[[str], Any], str]
+    if monthly_leftover > 0:
+        cash_flow_note = (
+            st.success,
+            f"✅ Je houdt maandelijks {_format_eur(monthly_leftover)} over "
+            f"voor sparen/beleggen",
+        )
+    elif monthly_leftover < 0:
+        cash_flow_note = (
+            st.error,
+            "⚠️ Je hebt een maandelijks tekort van "
+            + _format_eur(abs(monthly_leftover)),
         )
+    else:
+        cash_flow_note = (st.warning, "💡 Je inkomsten en uitgaven zijn precies gelijk")
+
+    # Text summary for net worth
+    net_worth_note: Tuple[Callable[[str], Any], str]
+    if net_worth > 0:
+        net_worth_note = (
+            st.success,
+            f"💰 Je eigen vermogen is {_format_eur(net_worth)}",
+        )
+    elif net_worth < 0:
+        net_worth_note = (
+            st.error,
+            "📉 Je hebt een negatief eigen vermogen van " + _format_eur(abs(net_worth)),
+        )
+    else:
+        net_worth_note = (
+            st.warning,
+            "💡 Je bezittingen en schulden zijn gelijk aan elkaar",
+        )
+
+    return _SummaryContent(
+        fingerprint=fingerprint,
+        metric_rows=(balance_metrics, cash_flow_metrics),
+        cash_flow_fig=create_cash_flow_visualization(
+            data.monthly_income, data.monthly_expenses, monthly_leftover
+        ),
+        net_worth_fig=create_net_worth_visualization(
+            data.total_assets, data.total_debt
+        ),
+        cash_flow_note=cash_flow_note,
+        net_worth_note=net_worth_note,
     )
 
-    fig.update_layout(
-        title="Eigen Vermogen Overzicht",
-        xaxis_title="Categorieën",
-        yaxis_title="Bedrag (€)",
-        showlegend=False,
-        height=400,
+
+@st.fragment
+def _show_summary_charts(content: _SummaryContent) -> None:
+    """Show the summary charts with their text summaries as a fragment.
+
+    Toggling interactivity only reruns the charts, not the rest of the
+    results page above them.
+    """
+    st.write("### 📈 Visualisatie")
+
+    # Charts render as static images unless the user asks for interactivity
+    chart_config = (
+        None
+        if st.toggle("Interactief", key="apk_interactive_charts")
+        else _STATIC_CHART_CONFIG
     )
 
-    return fig
+    # One tab per chart, each with its text summary below, so only the chart
+    # being looked at takes up the page
+    charts = (
+        (content.cash_flow_fig, content.cash_flow_note),
+        (content.net_worth_fig, content.net_worth_note),
+    )
+    for tab, (fig, (show_note, note)) in zip(st.tabs(_SUMMARY_CHART_TABS), charts):
+        with tab:
+            st.plotly_chart(
+                fig, use_container_width=True, theme=None, config=chart_config
+            )
+            show_note(note)
 
 
 def display_summary(data: FinancieleAPKData) -> None:
@@ -2259,7 +2636,7 @@ def display_summary(data: FinancieleAPKData) -> None:
     >>> data = FinancieleAPKData(
     ...     monthly_income=3000.0, monthly_expenses=2500.0,
     ...     monthly_leftover=500.0, total_assets=10000.0, total_debt=5000.0,
-    ...     assets=[], liabilities=[], income_streams=[], expense_streams=[]
+    ...     assets=(), liabilities=(), income_streams=(), expense_streams=()
     ... )
     >>> display_summary(data)
     # Displays metrics and charts for Financiele APK
@@ -2270,265 +2647,259 @@ def display_summary(data: FinancieleAPKData) -> None:
     Includes interactive visualizations for better understanding of cash flow
     and net worth.
     """
-    # Calculate totals from the data
-    net_worth = data.total_assets - data.total_debt
-    # Use the user-provided monthly_leftover instead of calculating it
-    monthly_leftover = data.monthly_leftover
+    # Reuse the summary built on a previous rerun while the amounts are
+    # unchanged; only the Streamlit elements are emitted again
+    fingerprint = (
+        data.monthly_income,
+        data.monthly_expenses,
+        data.monthly_leftover,
+        data.total_assets,
+        data.total_debt,
+    )
+    content = st.session_state.get(_SUMMARY_CONTENT_KEY)
+    if content is None or content.fingerprint != fingerprint:
+        content = _build_summary_content(data, fingerprint)
+        st.session_state[_SUMMARY_CONTENT_KEY] = content
 
     # Display summary metrics
     st.write("### 📊 Financiele APK")
 
-    # Assets, Liabilities, and Net Worth
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Totale Bezittingen", f"€{data.total_assets:,.2f}")
-    with col2:
-        st.metric("Totale Schulden", f"€{data.total_debt:,.2f}")
-    with col3:
-        st.metric("Eigen Vermogen", f"€{net_worth:,.2f}")
+    # Assets, Liabilities, and Net Worth, followed by the Monthly Cash Flow
+    for metrics in content.metric_rows:
+        display_metric_row(metrics)
+        st.write("---")
 
-    st.write("---")
+    # Visualizations Section
+    _show_summary_charts(content)
 
-    # Monthly Cash Flow
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Maandelijkse Inkomsten", f"€{data.monthly_income:,.2f}")
-    with col2:
-        st.metric("Maandelijkse Uitgaven", f"€{data.monthly_expenses:,.2f}")
-    with col3:
-        label = "Maandelijks Over" if monthly_leftover >= 0 else "Maandelijks Tekort"
-        delta_color = "normal" if monthly_leftover >= 0 else "inverse"
-        st.metric(
-            label,
-            f"€{abs(monthly_leftover):,.2f}",
-            delta=f"{'Positief' if monthly_leftover >= 0 else 'Negatief'} saldo",
-            delta_color=delta_color,
-        )
 
-    st.write("---")
+def _rerun_apk() -> None:
+    """Rerun the APK fragment, or the whole app on a full-app run.
 
-    # Visualizations Section
-    st.write("### 📈 Visualisatie")
+    Streamlit only accepts a fragment-scoped rerun while the fragment itself is
+    being rerun, e.g. the first render after a page load is a full-app run.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
 
-    # Create two columns for the charts
-    col1, col2 = st.columns(2)
 
-    with col1:
-        st.write("**Maandelijks overzicht**")
-        cash_flow_fig = create_cash_flow_visualization(data)
-        st.plotly_chart(cash_flow_fig, use_container_width=True)
+def _get_financial_data(
+    apk_mode: str, questionnaire_data: Dict[str, Any]
+) -> FinancieleAPKData:
+    """Get the APK data for the answers, converting only when they changed.
 
-        # Text summary for cash flow
-        if data.monthly_leftover > 0:
-            st.success(
-                f"✅ Je houdt maandelijks €{data.monthly_leftover:,.2f} over "
-                f"voor sparen/beleggen"
-            )
-        elif data.monthly_leftover < 0:
-            st.error(
-                f"⚠️ Je hebt een maandelijks tekort van "
-                f"€{abs(data.monthly_leftover):,.2f}"
-            )
-        else:
-            st.warning("💡 Je inkomsten en uitgaven zijn precies gelijk")
+    The converted data is kept in session state together with the mode and
+    answers it came from, so reruns on the results page skip the conversion.
+    """
+    source = (apk_mode, questionnaire_data)
+    if st.session_state.get("financial_data_source") != source:
+        convert = (
+            comprehensive_data_to_financiele_apk
+            if apk_mode == "comprehensive"
+            else questionnaire_data_to_financiele_apk
+        )
+        st.session_state.financial_data = convert(questionnaire_data)
+        st.session_state.financial_data_source = source
+    return cast(FinancieleAPKData, st.session_state.financial_data)
+
+
+def _reset_apk() -> None:
+    """Button callback: clear the APK flow state and restart at onboarding."""
+    # Reset session state to restart the flow
+    st.session_state.update(apk_step="onboarding", apk_started=False)
+    for key in (
+        "apk_mode",
+        "questionnaire_data",
+        "financial_data",
+        "financial_data_source",
+        _SUMMARY_CONTENT_KEY,
+    ):
+        st.session_state.pop(key, None)
+    # Also reset questionnaire data for both modes. The answers live in session
+    # state, so the shared cached instances are kept and only this session's
+    # keys are dropped; clearing the resource cache would not discard them
+    create_financiele_apk_questionnaire().reset()
+    create_comprehensive_financiele_apk_questionnaire().reset()
 
-    with col2:
-        st.write("**Vermogen overzicht**")
-        net_worth_fig = create_net_worth_visualization(data)
-        st.plotly_chart(net_worth_fig, use_container_width=True)
-
-        # Text summary for net worth
-        if net_worth > 0:
-            st.success(f"💰 Je eigen vermogen is €{net_worth:,.2f}")
-        elif net_worth < 0:
-            st.error(
-                f"📉 Je hebt een negatief eigen vermogen van €{abs(net_worth):,.2f}"
-            )
-        else:
-            st.warning("💡 Je bezittingen en schulden zijn gelijk aan elkaar")
 
+def _show_apk_results() -> None:
+    """Render the results step of the APK flow.
 
-def show_financiele_apk() -> None:
-    """Display the complete Financiele APK calculator interface.
+    Only called once the questionnaire is done, so the conversion,
+    validation and summary never run during the earlier steps.
+    """
+    # Show progress at 100% when showing results
+    display_progress_indicator(
+        progress_value=1.0,
+        title="Voortgang Financiële APK",
+        subtitle="APK voltooid!",
+        show_percentage=True,
+    )
 
-    Main entry point for the Financiele APK calculator. Implements a step-by-step
-    flow starting with onboarding, then questionnaire, and finally results.
+    questionnaire_data = st.session_state.get("questionnaire_data", {})
+    apk_mode = st.session_state.get("apk_mode", "quick")
 
-    Returns
-    -------
-    None
-        This function creates Streamlit UI components directly
+    # Convert questionnaire data to Financiele APK data based on mode
+    if apk_mode == "comprehensive":
+        financial_data = _get_financial_data(apk_mode, questionnaire_data)
 
-    Example
-    -------
-    >>> # In Streamlit app:
-    >>> show_financiele_apk()
-    # Creates expandable "💶 Financiele APK" section with step-by-step flow
+        # For comprehensive mode, skip the old validation since we have detailed data
+        st.success("Uitgebreide APK voltooid! Hier is je complete Financiele APK:")
 
-    Note
-    ----
-    Uses session state to track progress through the assessment steps.
-    Starts with onboarding, then moves to questionnaire and results.
-    """
-    with st.expander("💶 Financiele APK", expanded=True):
-        # Initialize session state for APK flow
-        if "apk_step" not in st.session_state:
-            st.session_state.apk_step = "onboarding"
-        if "apk_started" not in st.session_state:
-            st.session_state.apk_started = False
-
-        # Step 1: Onboarding
-        if st.session_state.apk_step == "onboarding":
-            if show_onboarding():
-                st.session_state.apk_step = "questionnaire"
-                st.session_state.apk_started = True
-                st.rerun()
+        # Display completeness warnings
+        display_data_completeness_warnings(questionnaire_data, apk_mode)
 
-        # Step 2: Questionnaire
-        elif st.session_state.apk_step == "questionnaire":
-            st.write("### Financiele APK - Uitgebreide Vragenlijst")
+    else:
+        # Quick mode: convert once, then validate the converted amounts so
+        # the answers are only read by the (cached) conversion
+        financial_data = _get_financial_data(apk_mode, questionnaire_data)
+        is_consistent, warning_message = validate_financial_consistency(
+            financial_data.monthly_income,
+            financial_data.monthly_expenses,
+            financial_data.monthly_leftover,
+        )
 
-            # Add mode selection
-            if "apk_mode" not in st.session_state:
-                st.session_state.apk_mode = None
+        if not is_consistent:
+            st.warning(warning_message)
+            st.info(
+                "💡 We gebruiken je opgegeven bedragen, maar controleer "
+                "deze nog even."
+            )
 
-            if st.session_state.apk_mode is None:
-                st.write("Kies je voorkeur:")
-                col1, col2 = st.columns(2)
+        st.success("Snelle APK voltooid! Hier is je Financiele APK:")
 
-                with col1:
-                    if st.button(
-                        "🚀 Snelle APK",
-                        key="quick_mode",
-                        help="4 basis vragen voor een snelle analyse",
-                    ):
-                        st.session_state.apk_mode = "quick"
-                        st.rerun()
+    st.write("---")
 
-                with col2:
-                    if st.button(
-                        "📊 Uitgebreide APK",
-                        key="comprehensive_mode",
-                        help="Volledige analyse met 8 categorieën",
-                    ):
-                        st.session_state.apk_mode = "comprehensive"
-                        st.rerun()
+    # Display the summary
+    display_summary(financial_data)
 
-                return  # Don't proceed until mode is selected
+    # Add reset button to allow starting over
+    st.write("---")
+    # The reset runs in the click callback, so the rerun that follows the
+    # click already starts at onboarding
+    st.button("Nieuwe APK starten", key="reset_questionnaire", on_click=_reset_apk)
 
-            # Run the selected questionnaire mode
-            if st.session_state.apk_mode == "quick":
-                questionnaire = create_financiele_apk_questionnaire()
 
-                # Calculate dynamic progress based on questionnaire step
-                current_step = questionnaire._get_current_step()
-                total_steps = len(questionnaire.questions)
+@st.fragment
+def _apk_fragment() -> None:
+    """Render the current APK step as a fragment.
 
-                # Progress ranges from 0% (start) to 100% (completion)
-                overall_progress = (
-                    (current_step / total_steps) if total_steps > 0 else 0
-                )
+    Step transitions rerun only this fragment instead of the whole page.
+    """
+    # Initialize session state for APK flow
+    step = st.session_state.setdefault("apk_step", "onboarding")
+    st.session_state.setdefault("apk_started", False)
+
+    # Step 1: Onboarding
+    if step == "onboarding":
+        if show_onboarding():
+            st.session_state.apk_step = "questionnaire"
+            st.session_state.apk_started = True
+            _rerun_apk()
+
+    # Step 2: Questionnaire
+    elif step == "questionnaire":
+        st.write("### Financiele APK - Uitgebreide Vragenlijst")
+
+        # Add mode selection
+        if "apk_mode" not in st.session_state:
+            st.session_state.apk_mode = None
+
+        if st.session_state.apk_mode is None:
+            st.write("Kies je voorkeur:")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if st.button(
+                    "🚀 Snelle APK",
+                    key="quick_mode",
+                    help="4 basis vragen voor een snelle analyse",
+                ):
+                    st.session_state.apk_mode = "quick"
+                    _rerun_apk()
 
-                # Show dynamic progress indicator
-                display_progress_indicator(
-                    progress_value=overall_progress,
-                    title="Voortgang Financiële APK - Snelle Modus",
-                    subtitle=(
-                        f"Vraag {current_step + 1} van {total_steps}"
-                        if current_step < total_steps
-                        else "Vragenlijst voltooid"
-                    ),
-                    show_percentage=True,
-                )
+            with col2:
+                if st.button(
+                    "📊 Uitgebreide APK",
+                    key="comprehensive_mode",
+                    help="Volledige analyse met 8 categorieën",
+                ):
+                    st.session_state.apk_mode = "comprehensive"
+                    _rerun_apk()
 
-                questionnaire_data = questionnaire.run()
+            return  # Don't proceed until mode is selected
 
-                # If questionnaire is completed, show results
-                if questionnaire_data is not None:
-                    st.session_state.apk_step = "results"
-                    st.session_state.questionnaire_data = questionnaire_data
-                    st.rerun()
+        # Run the selected questionnaire mode
+        if st.session_state.apk_mode == "quick":
+            questionnaire = create_financiele_apk_questionnaire()
 
-            elif st.session_state.apk_mode == "comprehensive":
-                # Use the comprehensive categorical questionnaire
-                questionnaire = create_comprehensive_financiele_apk_questionnaire()
-                questionnaire_data = questionnaire.run()
+            # Calculate dynamic progress based on questionnaire step
+            current_step = questionnaire._get_current_step()
+            total_steps = len(questionnaire.questions)
 
-                # If questionnaire is completed, show results
-                if questionnaire_data is not None:
-                    st.session_state.apk_step = "results"
-                    st.session_state.questionnaire_data = questionnaire_data
-                    st.rerun()
+            # Progress ranges from 0% (start) to 100% (completion)
+            overall_progress = (current_step / total_steps) if total_steps > 0 else 0
 
-        # Step 3: Results
-        elif st.session_state.apk_step == "results":
-            # Show progress at 100% when showing results
+            # Show dynamic progress indicator
             display_progress_indicator(
-                progress_value=1.0,
-                title="Voortgang Financiële APK",
-                subtitle="APK voltooid!",
+                progress_value=overall_progress,
+                title="Voortgang Financiële APK - Snelle Modus",
+                subtitle=(
+                    f"Vraag {current_step + 1} van {total_steps}"
+                    if current_step < total_steps
+                    else "Vragenlijst voltooid"
+                ),
                 show_percentage=True,
             )
 
-            questionnaire_data = st.session_state.get("questionnaire_data", {})
-            apk_mode = st.session_state.get("apk_mode", "quick")
+            questionnaire_data = questionnaire.run()
 
-            # Convert questionnaire data to Financiele APK data based on mode
-            if apk_mode == "comprehensive":
-                financial_data = comprehensive_data_to_financiele_apk(
-                    questionnaire_data
-                )
+            # If questionnaire is completed, show results
+            if questionnaire_data is not None:
+                st.session_state.apk_step = "results"
+                st.session_state.questionnaire_data = questionnaire_data
+                _rerun_apk()
 
-                # For comprehensive mode, skip the old validation since we have detailed data
-                st.success(
-                    "Uitgebreide APK voltooid! Hier is je complete Financiele APK:"
-                )
+        elif st.session_state.apk_mode == "comprehensive":
+            # Use the comprehensive categorical questionnaire
+            questionnaire = create_comprehensive_financiele_apk_questionnaire()
+            questionnaire_data = questionnaire.run()
 
-                # Display completeness warnings
-                display_data_completeness_warnings(questionnaire_data, apk_mode)
+            # If questionnaire is completed, show results
+            if questionnaire_data is not None:
+                st.session_state.apk_step = "results"
+                st.session_state.questionnaire_data = questionnaire_data
+                _rerun_apk()
 
-            else:
-                # Original quick mode validation and conversion
-                monthly_income = questionnaire_data.get("monthly_income", 0.0)
-                monthly_expenses = questionnaire_data.get("monthly_expenses", 0.0)
-                monthly_leftover = questionnaire_data.get("monthly_leftover", 0.0)
+    # Step 3: Results
+    elif step == "results":
+        _show_apk_results()
 
-                is_consistent, warning_message = validate_financial_consistency(
-                    monthly_income, monthly_expenses, monthly_leftover
-                )
 
-                if not is_consistent:
-                    st.warning(warning_message)
-                    st.info(
-                        "💡 We gebruiken je opgegeven bedragen, maar controleer "
-                        "deze nog even."
-                    )
+def show_financiele_apk() -> None:
+    """Display the complete Financiele APK calculator interface.
 
-                financial_data = questionnaire_data_to_financiele_apk(
-                    questionnaire_data
-                )
-                st.success("Snelle APK voltooid! Hier is je Financiele APK:")
-
-            st.write("---")
-
-            # Display the summary
-            display_summary(financial_data)
-
-            # Add reset button to allow starting over
-            st.write("---")
-            if st.button("Nieuwe APK starten", key="reset_questionnaire"):
-                # Reset session state to restart the flow
-                st.session_state.apk_step = "onboarding"
-                st.session_state.apk_started = False
-                if "apk_mode" in st.session_state:
-                    del st.session_state.apk_mode
-                if "questionnaire_data" in st.session_state:
-                    del st.session_state.questionnaire_data
-                # Also reset questionnaire data for both modes
-                quick_questionnaire = create_financiele_apk_questionnaire()
-                quick_questionnaire.reset()
-                comprehensive_questionnaire = (
-                    create_comprehensive_financiele_apk_questionnaire()
-                )
-                comprehensive_questionnaire.reset()
-                st.rerun()
+    Main entry point for the Financiele APK calculator. Implements a step-by-step
+    flow starting with onboarding, then questionnaire, and finally results.
+
+    Returns
+    -------
+    None
+        This function creates Streamlit UI components directly
+
+    Example
+    -------
+    >>> # In Streamlit app:
+    >>> show_financiele_apk()
+    # Creates expandable "💶 Financiele APK" section with step-by-step flow
+
+    Note
+    ----
+    Uses session state to track progress through the assessment steps.
+    Starts with onboarding, then moves to questionnaire and results. The steps
+    render inside a fragment, so interactions only rerun the APK section.
+    """
+    with st.expander("💶 Financiele APK", expanded=True):
+        _apk_fragment()
@@ -1,16 +1,40 @@
 """Compound interest calculator for investment growth analysis."""
 
 from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
 
 import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.UI_components.Basic import display_metric_row
 
-@dataclass
+# Monthly points beyond this are downsampled before plotting; the chart is
+# only a few hundred pixels wide.
+_MAX_PLOT_POINTS = 500
+
+# Currency format of the result metrics and messages
+_format_eur: Callable[[float], str] = "€{:,.2f}".format
+
+# Compounding frequency options and their number of periods per year
+_FREQ_MAP: Dict[str, int] = {
+    "Jaarlijks": 1,
+    "Halfjaarlijks": 2,
+    "Per kwartaal": 4,
+    "Maandelijks": 12,
+}
+_FREQ_LABELS: Tuple[str, ...] = tuple(_FREQ_MAP)
+
+# Session state key of the last calculated results
+_RESULTS_KEY = "compound_interest_results"
+
+
+@dataclass(frozen=True, slots=True)
 class InvestmentParameters:
-    """Parameters for investment calculations."""
+    """Parameters for investment calculations.
+
+    Immutable, so one instance can safely key the calculation caches.
+    """
 
     principal: float
     interest_rate: float
@@ -20,6 +44,16 @@ class InvestmentParameters:
     compounds_per_year: int
 
 
+class _GrowthResults(NamedTuple):
+    """Results of the last "Bereken" click, with the inputs they belong to."""
+
+    params: InvestmentParameters
+    values: np.ndarray
+    total_contributions: float
+    interest_earned: float
+    fig: go.Figure
+
+
 def get_user_input() -> Tuple[InvestmentParameters, bool]:
     """Get user input from Streamlit widgets and return investment parameters."""
     # Simple mode by default
@@ -53,7 +87,7 @@ def get_user_input() -> Tuple[InvestmentParameters, bool]:
             )
             compounds_per_year = st.selectbox(
                 "Samenstellingsfrequentie",
-                ["Jaarlijks", "Halfjaarlijks", "Per kwartaal", "Maandelijks"],
+                _FREQ_LABELS,
                 index=0,
             )
         with col2:
@@ -62,13 +96,7 @@ def get_user_input() -> Tuple[InvestmentParameters, bool]:
             )
 
         # Convert compounding frequency to number
-        frequency_dict = {
-            "Jaarlijks": 1,
-            "Halfjaarlijks": 2,
-            "Per kwartaal": 4,
-            "Maandelijks": 12,
-        }
-        compounds_per_year = frequency_dict[compounds_per_year]
+        compounds_per_year = _FREQ_MAP[compounds_per_year]
 
     calculate_button = st.button("Bereken")
 
@@ -84,19 +112,21 @@ def get_user_input() -> Tuple[InvestmentParameters, bool]:
     return params, calculate_button
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
 def calculate_investment_growth(
     params: InvestmentParameters,
-) -> Tuple[Sequence[float], float, float]:
+) -> Tuple[np.ndarray, float, float]:
     """Calculate investment growth over time with compound interest.
 
     Args:
         params (InvestmentParameters): Investment parameters including principal,
-            interest rate, monthly contributions, and time period.
+            interest rate, compounding frequency, monthly contributions, and
+            time period.
 
     Returns
     -------
-    Tuple[Sequence[float], float, float]: A tuple containing:
-        - List of investment values over time (monthly)
+    Tuple[np.ndarray, float, float]: A tuple containing:
+        - Array of investment values over time (monthly)
         - Total contributions (principal + monthly contributions)
         - Total interest earned (final amount - total contributions)
 
@@ -114,23 +144,30 @@ def calculate_investment_growth(
         361
     """
     rate = params.interest_rate / 100
-    monthly_rate = rate / 12
+    # The nominal annual rate compounds compounds_per_year times a year;
+    # convert it to the equivalent monthly rate, (1 + r/k)^(k/12) - 1, so
+    # contributions can still be added every month
+    periods = params.compounds_per_year
+    monthly_rate = float(np.expm1(periods / 12 * np.log1p(rate / periods)))
     months = int(params.time_years * 12)
 
-    values = []
-    total_contributions = params.principal
-    current_amount = params.principal
-
-    for month in range(months + 1):
-        values.append(current_amount)
-        if month < months:
-            current_amount = (current_amount + params.monthly_contribution) * (
-                1 + monthly_rate
-            )
-            total_contributions += params.monthly_contribution
+    # Closed form of the monthly recurrence v[n+1] = (v[n] + C) * (1 + r):
+    # contributions are made at the start of each month (annuity-due).
+    n = np.arange(months + 1, dtype=np.float64)
+    if monthly_rate:
+        growth = (1.0 + monthly_rate) ** n
+        values = (
+            params.principal * growth
+            + params.monthly_contribution
+            * (1.0 + monthly_rate)
+            * (growth - 1.0)
+            / monthly_rate
+        )
+    else:
+        values = params.principal + n * params.monthly_contribution
 
-    final_amount = values[-1]
-    interest_earned = final_amount - total_contributions
+    total_contributions = params.principal + months * params.monthly_contribution
+    interest_earned = float(values[-1]) - total_contributions
 
     return values, total_contributions, interest_earned
 
@@ -154,10 +191,11 @@ def calculate_years_to_goal(
         >>> calculate_years_to_goal(values, 1500)
         0.25  # Takes 3 months (0.25 years) to reach 1500
     """
-    if values[-1] >= goal_amount:
-        for i, value in enumerate(values):
-            if value >= goal_amount:
-                return i / 12
+    # Inputs are non-negative, so the trajectory never decreases and the
+    # first month at or above the goal can be found by binary search.
+    index = int(np.searchsorted(values, goal_amount, side="left"))
+    if index < len(values):
+        return index / 12
     return None
 
 
@@ -187,18 +225,19 @@ def display_results(
     years_to_goal = calculate_years_to_goal(values, goal_amount)
 
     st.write("### Resultaten")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Eindbedrag", f"€{final_amount:,.2f}")
-    with col2:
-        st.metric("Totaal ingelegd", f"€{total_contributions:,.2f}")
-    with col3:
-        st.metric("Verdiende rente", f"€{interest_earned:,.2f}")
+    display_metric_row(
+        (
+            ("Eindbedrag", _format_eur(final_amount), None, "normal"),
+            ("Totaal ingelegd", _format_eur(total_contributions), None, "normal"),
+            ("Verdiende rente", _format_eur(interest_earned), None, "normal"),
+        )
+    )
 
     # Display goal achievement message
     if years_to_goal:
         st.success(
-            f"Je bereikt je doel van €{goal_amount:,.2f} in {years_to_goal:.1f} jaar!"
+            f"Je bereikt je doel van {_format_eur(goal_amount)} "
+            f"in {years_to_goal:.1f} jaar!"
         )
     elif goal_amount > 0:
         st.warning(
@@ -207,14 +246,57 @@ def display_results(
         )
 
 
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select points to plot with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; from each bucket in between
+    the point forming the largest triangle with the previously selected
+    point and the average of the next bucket is chosen, which preserves the
+    visual shape of the line far better than a fixed stride.
+
+    Args:
+        x (np.ndarray): X coordinates in ascending order
+        y (np.ndarray): Y coordinates
+        threshold (int): Number of points to keep (at least 3)
+
+    Returns
+    -------
+    np.ndarray: Sorted indices of the selected points
+    """
+    n = len(x)
+    bucket_size = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+# A cache_data hit would unpickle the figure, which re-runs plotly's
+# validation; the figure is never mutated after construction, so share it
+@st.cache_resource(show_spinner=False, max_entries=64)
 def create_investment_graph(
-    values: Sequence[float], time_years: int, goal_amount: float
+    values: np.ndarray, time_years: int, goal_amount: float
 ) -> go.Figure:
     """Create an interactive plot showing investment growth over time.
 
     Args:
-        values (Sequence[float]): List of investment values over time
-        time_years (int): Total investment period in years
+        values (np.ndarray): Investment values over time (monthly)
+        time_years (int): Total investment period in years (x-axis range)
         goal_amount (float): Target investment amount (0 for no goal)
 
     Returns
@@ -229,35 +311,66 @@ def create_investment_graph(
         - Hover information for values
         - Properly formatted axis labels and currency values
     """
-    years = np.linspace(0, time_years, len(values))
-
-    fig = go.Figure()
-
-    # Add investment growth line
-    fig.add_trace(go.Scatter(x=years, y=values, name="Totaal bedrag", fill="tozeroy"))
-
-    # Add goal line if goal is set
+    # One value per month; float32 is plenty for a display-only axis.
+    years = np.arange(len(values), dtype=np.float32) / 12
+    if len(values) > _MAX_PLOT_POINTS:
+        keep = _lttb_indices(years, values, _MAX_PLOT_POINTS)
+        years, values = years[keep], values[keep]
+    # The trace is display-only, so halve the payload sent to the browser.
+    plot_values: np.ndarray = np.asarray(values, dtype=np.float32)
+
+    layout = {
+        "title": {"text": "Groei van investering over tijd"},
+        "xaxis": {"title": {"text": "Jaren"}, "range": [0, time_years]},
+        "yaxis": {"title": {"text": "Bedrag (€)"}, "tickprefix": "€"},
+        "hovermode": "x",
+        "showlegend": True,
+    }
+
+    # Add goal line if goal is set (the shape and label fig.add_hline would add)
     if goal_amount > 0:
-        fig.add_hline(
-            y=goal_amount,
-            line_dash="dash",
-            line_color="red",
-            annotation_text=f"Doel: €{goal_amount:,.0f}",
-            annotation_position="right",
-        )
-
-    # Customize the graph
-    fig.update_layout(
-        title="Groei van investering over tijd",
-        xaxis_title="Jaren",
-        yaxis_title="Bedrag (€)",
-        hovermode="x",
-        showlegend=True,
-        yaxis_tickprefix="€",
+        layout["shapes"] = [
+            {
+                "type": "line",
+                "xref": "x domain",
+                "x0": 0,
+                "x1": 1,
+                "yref": "y",
+                "y0": goal_amount,
+                "y1": goal_amount,
+                "line": {"color": "red", "dash": "dash"},
+            }
+        ]
+        layout["annotations"] = [
+            {
+                "text": f"Doel: €{goal_amount:,.0f}",
+                "showarrow": False,
+                "xref": "x domain",
+                "x": 1,
+                "xanchor": "left",
+                "yref": "y",
+                "y": goal_amount,
+                "yanchor": "middle",
+            }
+        ]
+
+    # Build the figure from one plain spec so plotly validates it only once;
+    # WebGL keeps long horizons responsive
+    return go.Figure(
+        {
+            "data": [
+                {
+                    "type": "scattergl",
+                    "x": years,
+                    "y": plot_values,
+                    "name": "Totaal bedrag",
+                    "fill": "tozeroy",
+                }
+            ],
+            "layout": layout,
+        }
     )
 
-    return fig
-
 
 def show_compound_interest_calculator() -> None:
     """Display and run the compound interest calculator in Streamlit.
@@ -280,15 +393,26 @@ def show_compound_interest_calculator() -> None:
     with st.expander("💰 Samengestelde Interest Calculator", expanded=False):
         params, calculate_clicked = get_user_input()
 
-        if calculate_clicked:
+        results = st.session_state.get(_RESULTS_KEY)
+        if calculate_clicked and (results is None or results.params != params):
             # Calculate investment growth
             values, total_contributions, interest_earned = calculate_investment_growth(
                 params
             )
+            fig = create_investment_graph(values, params.time_years, params.goal_amount)
+            results = _GrowthResults(
+                params, values, total_contributions, interest_earned, fig
+            )
+            st.session_state[_RESULTS_KEY] = results
 
+        # Keep showing the last results on unrelated reruns until the inputs
+        # change, without recomputing them
+        if results is not None and results.params == params:
             # Display results and graph
             display_results(
-                values, total_contributions, interest_earned, params.goal_amount
+                results.values,
+                results.total_contributions,
+                results.interest_earned,
+                params.goal_amount,
             )
-            fig = create_investment_graph(values, params.time_years, params.goal_amount)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(results.fig, use_container_width=True)
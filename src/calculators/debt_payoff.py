@@ -7,8 +7,15 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
+# Payoff simulations stop after this many months (30 years)
+_MAX_MONTHS = 360
 
-@dataclass
+# A debt counts as paid off once less than half a cent is left; smaller
+# balances are floating-point residue of the interest calculations
+_PAID_OFF = 0.005
+
+
+@dataclass(frozen=True, slots=True)
 class Debt:
     """Represents a debt with balance, interest rate, and minimum payment."""
 
@@ -18,11 +25,14 @@ class Debt:
     min_payment: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DebtPayoffParameters:
-    """Parameters for debt payoff calculations."""
+    """Parameters for debt payoff calculations.
+
+    Immutable (with the debts as a tuple), so it can key the payoff caches.
+    """
 
-    debts: List[Debt]
+    debts: Tuple[Debt, ...]
     extra_payment: float
 
 
@@ -76,103 +86,195 @@ def get_user_input() -> Tuple[DebtPayoffParameters, bool]:
 
     calculate_button = st.button("Vergelijk methodes")
 
-    params = DebtPayoffParameters(debts=debts, extra_payment=extra_payment)
+    params = DebtPayoffParameters(debts=tuple(debts), extra_payment=extra_payment)
 
     return params, calculate_button
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
 def calculate_snowball_payoff(
     params: DebtPayoffParameters,
-) -> Tuple[Dict[str, List[float]], float, int]:
+) -> Tuple[Dict[str, np.ndarray], float, int]:
     """Calculate debt payoff using the snowball method (smallest balance first)."""
     debts = sorted(params.debts, key=lambda x: x.balance)
     return calculate_payoff(params, debts)
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
 def calculate_avalanche_payoff(
     params: DebtPayoffParameters,
-) -> Tuple[Dict[str, List[float]], float, int]:
+) -> Tuple[Dict[str, np.ndarray], float, int]:
     """Calculate debt payoff using the avalanche method (highest interest first)."""
     debts = sorted(params.debts, key=lambda x: x.interest_rate, reverse=True)
     return calculate_payoff(params, debts)
 
 
+def _pay_month(
+    balances: np.ndarray,
+    monthly_rates: np.ndarray,
+    min_payments: np.ndarray,
+    extra_payment: float,
+) -> Tuple[np.ndarray, float]:
+    """Apply one month of interest and payments to all debts at once.
+
+    Every open debt accrues interest and gets its minimum payment (capped at
+    what is owed); the extra payment then goes to the first debt, in payoff
+    order, that still has a balance.
+
+    Returns the new balances and the amount paid this month.
+    """
+    is_open = balances > _PAID_OFF
+    owed = balances + balances * monthly_rates
+    payments = np.where(is_open, np.minimum(owed, min_payments), 0.0)
+    new_balances = np.where(is_open, owed - payments, 0.0)
+    paid = float(payments.sum())
+
+    # Then, apply extra payment to the first debt with a balance
+    if extra_payment > 0:
+        still_open = np.flatnonzero(new_balances > _PAID_OFF)
+        if still_open.size:
+            target = still_open[0]
+            payment = min(new_balances[target], extra_payment)
+            new_balances[target] -= payment
+            paid += payment
+
+    return new_balances, paid
+
+
+def _amortize(
+    balances: np.ndarray,
+    monthly_rates: np.ndarray,
+    payments: np.ndarray,
+    months: int,
+) -> np.ndarray:
+    """Return the balances after 1..months fixed monthly payments.
+
+    Uses the amortization formula B*(1+r)^k - P*((1+r)^k - 1)/r (or B - P*k
+    without interest), so no debt may be paid off within these months.
+    Rows are months, columns are debts.
+    """
+    k = np.arange(1, months + 1, dtype=np.float64)[:, None]
+    growth = (1.0 + monthly_rates) ** k
+    # Sum of the growth factors of k payments; k itself when there is no rate
+    paid_factor = np.divide(
+        growth - 1.0,
+        monthly_rates,
+        out=np.broadcast_to(k, growth.shape).copy(),
+        where=monthly_rates > 0,
+    )
+    return np.asarray(balances * growth - payments * paid_factor, dtype=np.float64)
+
+
+def _months_until_paid_off(
+    balances: np.ndarray, monthly_rates: np.ndarray, payments: np.ndarray
+) -> float:
+    """Return the month in which the first open debt is paid off.
+
+    Solves B*(1+r)^n - P*((1+r)^n - 1)/r <= 0 for each open debt, giving
+    n = -log(1 - r*B/P) / log(1 + r), and returns the smallest n rounded up.
+    Debts whose payment does not exceed their interest never clear; inf is
+    returned when that holds for all of them.
+    """
+    is_open = balances > _PAID_OFF
+    balances, monthly_rates, payments = (
+        balances[is_open],
+        monthly_rates[is_open],
+        payments[is_open],
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = monthly_rates * balances / payments
+        months = np.where(
+            monthly_rates > 0,
+            -np.log1p(-share) / np.log1p(monthly_rates),
+            balances / payments,
+        )
+    months = np.where((payments > 0) & (share < 1), np.ceil(months), np.inf)
+    return float(months.min())
+
+
 def calculate_payoff(
     params: DebtPayoffParameters, ordered_debts: List[Debt]
-) -> Tuple[Dict[str, List[float]], float, int]:
+) -> Tuple[Dict[str, np.ndarray], float, int]:
     """Calculate debt payoff progression."""
-    monthly_balances = {debt.name: [debt.balance] for debt in ordered_debts}
+    # One slot per debt, in payoff order
+    balances = np.array([debt.balance for debt in ordered_debts], dtype=np.float64)
+    monthly_rates = np.array(
+        [debt.interest_rate / 100 / 12 for debt in ordered_debts], dtype=np.float64
+    )
+    min_payments = np.array(
+        [debt.min_payment for debt in ordered_debts], dtype=np.float64
+    )
+
+    history = [balances]
     total_paid = 0.0
     months = 0
 
-    # Continue while any debt has a balance
-    while any(balances[-1] > 0 for balances in monthly_balances.values()):
-        available_payment = params.extra_payment
-        new_balances = {}
-
-        # First, make minimum payments on all debts
-        for debt in ordered_debts:
-            current_balance = monthly_balances[debt.name][-1]
-            if current_balance > 0:
-                # Calculate interest
-                interest = current_balance * (debt.interest_rate / 100 / 12)
-                payment = min(current_balance + interest, debt.min_payment)
-                new_balance = current_balance + interest - payment
-                total_paid += payment
-                available_payment = max(
-                    0, available_payment - max(0, payment - debt.min_payment)
-                )
-            else:
-                new_balance = 0
-            new_balances[debt.name] = new_balance
-
-        # Then, apply extra payment to the first debt with a balance
-        for debt in ordered_debts:
-            if new_balances[debt.name] > 0 and available_payment > 0:
-                payment = min(new_balances[debt.name], available_payment)
-                new_balances[debt.name] -= payment
-                total_paid += payment
-                available_payment -= payment
-                break
-
-        # Add new balances to history
-        for name, balance in new_balances.items():
-            monthly_balances[name].append(balance)
-
+    # Continue while any debt has a balance, for at most 30 years. Between
+    # two payoffs every debt has a fixed payment, so those months follow in
+    # closed form; only the month a debt is paid off is simulated, as that is
+    # where payments shift to the next debt.
+    while months <= _MAX_MONTHS and (balances > _PAID_OFF).any():
+        is_open = balances > _PAID_OFF
+        balances = np.where(is_open, balances, 0.0)
+        payments = np.where(is_open, min_payments, 0.0)
+        payments[np.argmax(is_open)] += params.extra_payment
+
+        payoff_month = _months_until_paid_off(balances, monthly_rates, payments)
+        quiet_months = _MAX_MONTHS + 1 - months
+        if not np.isinf(payoff_month):
+            quiet_months = min(int(payoff_month) - 1, quiet_months)
+        if quiet_months >= 1:
+            path = _amortize(balances, monthly_rates, payments, quiet_months)
+            # Guard against rounding in the month estimate: keep only the
+            # months in which every open debt is still open
+            quiet_months = int(
+                np.logical_and.accumulate(
+                    (path[:, is_open] > _PAID_OFF).all(axis=1)
+                ).sum()
+            )
+        if quiet_months >= 1:
+            history.extend(path[:quiet_months])
+            balances = path[quiet_months - 1]
+            total_paid += quiet_months * float(payments.sum())
+            months += quiet_months
+            continue
+
+        balances, paid = _pay_month(
+            balances, monthly_rates, min_payments, params.extra_payment
+        )
+        history.append(balances)
+        total_paid += paid
         months += 1
-        if months > 360:  # 30 years maximum
-            break
 
-    return monthly_balances, total_paid, months
+    # Rows are months, columns are debts
+    monthly_balances = np.vstack(history)
+    return (
+        {debt.name: monthly_balances[:, i] for i, debt in enumerate(ordered_debts)},
+        total_paid,
+        months,
+    )
 
 
+# Kept as a resource: unpickling a cached figure would re-run plotly validation
+@st.cache_resource(show_spinner=False, max_entries=64)
 def create_payoff_graph(
-    snowball_data: Dict[str, List[float]],
-    avalanche_data: Dict[str, List[float]],
+    snowball_data: Dict[str, np.ndarray],
+    avalanche_data: Dict[str, np.ndarray],
     _months: int,  # Unused parameter prefixed with underscore
 ) -> go.Figure:
     """Create a comparison graph of both payoff methods showing total debt."""
     fig = go.Figure()
 
-    # Safely get the first value list to determine the number of months
-    first_snowball_values = list(snowball_data.values())[0] if snowball_data else []
-    if not first_snowball_values:
+    if not snowball_data or not avalanche_data:
         return fig
 
-    # Calculate total debt for each month for both methods
-    snowball_totals = []
-    avalanche_totals = []
-
-    for month in range(len(first_snowball_values)):
-        try:
-            snowball_total = sum(balances[month] for balances in snowball_data.values())
-            avalanche_total = sum(
-                balances[month] for balances in avalanche_data.values()
-            )
-            snowball_totals.append(snowball_total)
-            avalanche_totals.append(avalanche_total)
-        except IndexError:
-            break  # Stop if we hit the end of any balance list
+    # Calculate total debt for each month for both methods, up to the month
+    # the shorter of the two payoff schedules ends
+    snowball_totals = np.sum(list(snowball_data.values()), axis=0)
+    avalanche_totals = np.sum(list(avalanche_data.values()), axis=0)
+    months_shown = min(len(snowball_totals), len(avalanche_totals))
+    snowball_totals = snowball_totals[:months_shown]
+    avalanche_totals = avalanche_totals[:months_shown]
 
     # Convert months to years for x-axis
     years = np.linspace(0, len(snowball_totals) / 12, len(snowball_totals))
@@ -212,8 +314,8 @@ def create_payoff_graph(
 
 
 def display_results(
-    snowball_results: Tuple[Dict[str, List[float]], float, int],
-    avalanche_results: Tuple[Dict[str, List[float]], float, int],
+    snowball_results: Tuple[Dict[str, np.ndarray], float, int],
+    avalanche_results: Tuple[Dict[str, np.ndarray], float, int],
 ) -> None:
     """Display the comparison results."""
     _snowball_balances, snowball_total, snowball_months = snowball_results
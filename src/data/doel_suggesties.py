@@ -1,15 +1,37 @@
 """Financiële doelen suggesties voor de Financiële APK.
 
-Dit bestand bevat aanvullende suggesties voor financiële doelen
-die niet in de hoofdlijst staan, maar wel als auto-fill suggesties
-kunnen worden getoond wanneer gebruikers "Anders, namelijk:" kiezen.
+Dit bestand bevat de standaard opties voor financiële doelen, plus
+aanvullende suggesties die niet in de hoofdlijst staan, maar wel als
+auto-fill suggesties kunnen worden getoond wanneer gebruikers
+"Anders, namelijk:" kiezen.
 
 De doelen zijn georganiseerd per categorie voor betere vindbaarheid.
+Beide lijsten zijn tuples, zodat ze eenmalig worden opgebouwd en veilig
+gedeeld kunnen worden tussen vragen.
 """
 
+# Standaard opties voor financiële doelen (keuzelijst)
+FINANCIELE_DOEL_OPTIES = (
+    "Geldbuffer opbouwen van 6 maanden aan uitgaven",
+    "Overzicht krijgen in Financiën en uitgaven",
+    "(Studie) Schulden aflossen",
+    "Financieel gezond worden",
+    "Studie/opleiding",
+    "Huis kopen",
+    "Nieuwe waggie",
+    "Startkapitaal opbouwen om een eigen zaak te beginnen",
+    "Wereldreis/Sabbatical",
+    "Studie kinderen",
+    "Hypotheekschuld aflossen",
+    "Verbouwing",
+    "Pensioen opbouwen",
+    "Eerder stoppen met werken",
+    "Financiële Onafhankelijkheid",
+)
+
 # Extra suggesties voor financiële doelen
 # Let op: deze lijst bevat ALLEEN doelen die NIET in de standaard opties staan
-FINANCIELE_DOEL_SUGGESTIES = [
+FINANCIELE_DOEL_SUGGESTIES = (
     # 1. Schulden & financiële stabiliteit
     "Maandelijkse uitgaven verlagen of budgetteren",
     "Betalingsachterstanden voorkomen",
@@ -71,4 +93,4 @@ FINANCIELE_DOEL_SUGGESTIES = [
     "Familie financieel ondersteunen",
     "Schenking aan kinderen",
     "Erfenis planning",
-]
+)
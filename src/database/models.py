@@ -1,9 +1,12 @@
-"""Database models and schemas."""
+"""Database models and schemas.
+
+The records are frozen and slotted: they are only built, never modified.
+"""
 
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Asset:
     """Represents a financial asset with name and value."""
 
@@ -11,7 +14,7 @@ class Asset:
     value: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Liability:
     """Represents a financial liability with name and amount owed."""
 
@@ -19,7 +22,7 @@ class Liability:
     amount: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonthlyFlow:
     """Represents a monthly cash flow item (income or expense)."""
 